@@ -3,10 +3,9 @@ RemoteX - High-Performance SSH Management CLI for DevOps Engineers
 
 A feature-rich Python CLI tool for managing SSH connections and executing
 commands on remote servers with lightning-fast parallel execution.
-
-Version: 1.0.1
 """
 
+# Single source of truth for the version; pyproject.toml reads it at build time
 __version__ = "1.0.1"
 __author__ = "Sagar Memane <sagarmemane135@github.com>"
 __description__ = "High-Performance SSH Management CLI for DevOps Engineers"
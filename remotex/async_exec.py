@@ -0,0 +1,162 @@
+"""
+Async Execution Module
+Fan out commands to many hosts on a single asyncio event loop.
+
+Requires the optional ``asyncssh`` package (``pip install remotex[async]``).
+Bulk commands use it by default once it is installed (``backend: "auto"``),
+or always with ``backend: "asyncssh"``, and fall back to the threaded
+paramiko path when it is not installed.
+When ``uvloop`` is also installed (Linux and macOS), the event loop runs on
+libuv instead of the default selector loop.
+"""
+
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+try:
+    import asyncssh
+except ImportError:  # pragma: no cover - optional dependency
+    asyncssh = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
+
+def is_available() -> bool:
+    """Check whether asyncssh is installed."""
+    return asyncssh is not None
+
+
+async def run_one(
+    sem: asyncio.Semaphore,
+    host_alias: str,
+    command: str,
+    timeout: int = 30,
+    retries: int = 0,
+    only_exit_code: bool = False,
+    max_output: Optional[int] = None
+) -> Dict:
+    """
+    Execute a command on one host, bounded by a shared semaphore.
+
+    Host details (HostName, User, Port, IdentityFile, ProxyJump) are
+    resolved by asyncssh from ~/.ssh/config. Failed attempts are retried
+    with the same exponential backoff as ``retry_with_backoff``. With
+    ``only_exit_code`` the remote streams are sent to ``asyncssh.DEVNULL``.
+    With ``max_output`` only the last ``max_output`` characters of each
+    stream are kept, and ``truncated`` is set when anything was cut.
+    """
+    streams = {'stdout': asyncssh.DEVNULL, 'stderr': asyncssh.DEVNULL} if only_exit_code else {}
+    result: Dict = {}
+    delay = 1.0
+
+    for attempt in range(retries + 1):
+        result = {
+            'host': host_alias,
+            'success': False,
+            'output': '',
+            'error': '',
+            'exit_code': -1
+        }
+
+        async with sem:
+            try:
+                # known_hosts=None mirrors the AutoAddPolicy used by the paramiko path.
+                # connect_timeout keeps an unreachable host from holding a slot forever
+                async with asyncssh.connect(host_alias, known_hosts=None, connect_timeout=timeout) as conn:  # nosec B507
+                    completed = await conn.run(command, timeout=timeout, errors='ignore', **streams)
+                result['output'] = completed.stdout or ''
+                result['error'] = completed.stderr or ''
+                if max_output and (len(result['output']) > max_output or len(result['error']) > max_output):
+                    result['output'] = result['output'][-max_output:]
+                    result['error'] = result['error'][-max_output:]
+                    result['truncated'] = True
+                result['exit_code'] = completed.exit_status if completed.exit_status is not None else -1
+                result['success'] = result['exit_code'] == 0
+            except asyncssh.TimeoutError:
+                result['error'] = f'Command timed out after {timeout}s'
+            except Exception as e:
+                result['error'] = str(e)
+
+        if result['success'] or attempt == retries:
+            break
+        await asyncio.sleep(delay)
+        delay = min(delay * 2.0, 60.0)
+
+    return result
+
+
+async def _gather(
+    host_list: List[str],
+    command: str,
+    parallel: int,
+    timeout: int,
+    retries: int,
+    only_exit_code: bool,
+    on_result: Optional[Callable[[Dict], None]],
+    max_output: Optional[int]
+) -> List[Dict]:
+    sem = asyncio.Semaphore(parallel)
+    tasks = [
+        asyncio.ensure_future(run_one(sem, host, command, timeout, retries, only_exit_code, max_output))
+        for host in host_list
+    ]
+    if not on_result:
+        return list(await asyncio.gather(*tasks))
+
+    # Done callbacks queue finished tasks, and each wakeup hands on every
+    # task that finished since the last one instead of resuming once per
+    # host as asyncio.as_completed does
+    finished: asyncio.Queue = asyncio.Queue()
+    for task in tasks:
+        task.add_done_callback(finished.put_nowait)
+
+    remaining = len(tasks)
+    while remaining:
+        batch = [await finished.get()]
+        while not finished.empty():
+            batch.append(finished.get_nowait())
+        remaining -= len(batch)
+        for task in batch:
+            on_result(task.result())
+    return [task.result() for task in tasks]
+
+
+def run_all(
+    host_list: List[str],
+    command: str,
+    parallel: int = 5,
+    timeout: int = 30,
+    retries: int = 0,
+    only_exit_code: bool = False,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    max_output: Optional[int] = None
+) -> List[Dict]:
+    """
+    Execute a command on every host concurrently.
+
+    Args:
+        host_list: Host aliases to run on
+        command: Command to execute
+        parallel: Maximum number of concurrent connections
+        timeout: Command timeout in seconds
+        retries: Number of retry attempts on failure
+        only_exit_code: Discard command output and collect exit codes only
+        on_result: Called with each result as it completes (e.g. progress updates)
+        max_output: Keep only the tail of each host's output and error
+
+    Returns:
+        List of result dicts in host_list order
+    """
+    # A private loop rather than uvloop.install(), so the process-wide event
+    # loop policy is left alone for library callers
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(
+            _gather(host_list, command, parallel, timeout, retries, only_exit_code, on_result, max_output)
+        )
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
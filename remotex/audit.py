@@ -1,32 +1,102 @@
 """
 RemoteX Audit Logging
 Track all command executions for compliance and debugging
+
+Each command run produces exactly one audit entry. Bulk commands pass
+their whole result list to log_bulk_execution() once the run finishes;
+they must not log per host.
 """
 
+import atexit
+import functools
+from array import array
+import getpass
 import json
+import mmap
+import multiprocessing
+import os
+import queue
+import struct
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-from remotex.config import CONFIG_DIR, load_config
+from remotex.config import CONFIG_DIR, ENV_PREFIX, load_config
 
 AUDIT_LOG_FILE = CONFIG_DIR / "audit.log"
 
+# Rotated logs kept as audit.log.1 (newest) .. audit.log.N (oldest)
+AUDIT_LOG_BACKUPS = 5
+
+# Block size used when reading the audit log backwards
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+# Logs at least this large are scanned through mmap instead of block reads
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Searches spanning at least this much rotated log run one process per file
+_PARALLEL_SCAN_THRESHOLD = 64 * 1024 * 1024
+
+# Sidecar index record: (unix_time, offset, length) of one log line
+_INDEX_RECORD = struct.Struct('<QQQ')
 
+# How long the background writer collects entries before writing a batch
+_FLUSH_INTERVAL = 0.5
+
+
+@functools.lru_cache(maxsize=1)
 def is_audit_enabled() -> bool:
-    """Check if audit logging is enabled."""
+    """
+    Check if audit logging is enabled (read once per process).
+    
+    REMOTEX_AUDIT_ENABLED takes precedence over the config file, so when it
+    is set the config is never loaded just to answer this.
+    """
+    env_audit = os.getenv(f"{ENV_PREFIX}AUDIT_ENABLED")
+    if env_audit:
+        return env_audit.lower() in ("true", "1", "yes", "on")
     config = load_config()
     return config.get("audit_enabled", True)
 
 
+@functools.lru_cache(maxsize=1)
+def _audit_max_size() -> int:
+    """Size in bytes at which audit.log is rotated (0 disables rotation)."""
+    config = load_config()
+    return int(config.get("audit_max_size", 100 * 1024 * 1024))
+
+
+def invalidate_audit_config_cache():
+    """Forget the cached audit settings so the next check re-reads config."""
+    is_audit_enabled.cache_clear()
+    _audit_max_size.cache_clear()
+    _current_user.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _current_user() -> str:
+    """Look up the system user once per process."""
+    return getpass.getuser()
+
+
 def log_command_execution(
     command_type: str,
     hosts: List[str],
     command: str,
     results: Dict[str, Dict],
     user: Optional[str] = None,
-    metadata: Optional[Dict] = None
+    metadata: Optional[Dict] = None,
+    results_can_mutate: bool = False
 ):
     """
     Log a command execution to audit log.
@@ -38,34 +108,49 @@ def log_command_execution(
         results: Dict of {host: {success: bool, exit_code: int, output: str}}
         user: Username (defaults to system user)
         metadata: Additional metadata (group, tags, etc.)
+        results_can_mutate: Reuse the result dicts for the audit entry instead
+            of copying them; their output, error and host keys are removed
     """
     if not is_audit_enabled():
         return
     
-    import os
-    import getpass
+    # One clock read so timestamp and unix_time always agree
+    now = time.time()
+    
+    # Per-host results and success count in a single pass
+    host_results = results if results_can_mutate else {}
+    succeeded = 0
+    for host, res in results.items():
+        success = res.get("success", False)
+        if success:
+            succeeded += 1
+        if results_can_mutate:
+            res.setdefault("success", False)
+            res.setdefault("exit_code", -1)
+            res["output_length"] = len(res.pop("output", ""))
+            res.pop("error", None)
+            res.pop("host", None)
+        else:
+            host_results[host] = {
+                "success": success,
+                "exit_code": res.get("exit_code", -1),
+                "output_length": len(res.get("output", ""))
+            }
     
     # Build audit entry
     audit_entry = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "unix_time": int(time.time()),
-        "user": user or getpass.getuser(),
+        "timestamp": datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "unix_time": int(now),
+        "user": user or _current_user(),
         "command_type": command_type,
         "command": command,
         "hosts": hosts,
         "host_count": len(hosts),
-        "results": {
-            host: {
-                "success": res.get("success", False),
-                "exit_code": res.get("exit_code", -1),
-                "output_length": len(res.get("output", ""))
-            }
-            for host, res in results.items()
-        },
+        "results": host_results,
         "summary": {
             "total": len(hosts),
-            "succeeded": sum(1 for r in results.values() if r.get("success")),
-            "failed": sum(1 for r in results.values() if not r.get("success"))
+            "succeeded": succeeded,
+            "failed": len(host_results) - succeeded
         }
     }
     
@@ -73,29 +158,479 @@ def log_command_execution(
     if metadata:
         audit_entry["metadata"] = metadata
     
-    # Ensure audit directory exists
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    # Hand off to the background writer; the caller does not wait on disk I/O
+    line = _dumps(audit_entry) + b"\n"
+    _writer.enqueue(AUDIT_LOG_FILE, audit_entry["unix_time"], line)
+
+
+def log_bulk_execution(
+    command_type: str,
+    command: str,
+    results: List[Dict],
+    hosts: Optional[List[str]] = None,
+    metadata: Optional[Dict] = None,
+    results_can_mutate: bool = False
+):
+    """
+    Log a finished bulk run as a single aggregated audit entry.
+    
+    Args:
+        command_type: Type of command (exec-all, exec-multi, exec-group)
+        command: Command that was executed
+        results: Per-host result dicts as returned by the bulk executors
+        hosts: Target hosts (defaults to the hosts in results)
+        metadata: Additional metadata (group, parallel, timeout, etc.)
+        results_can_mutate: Let the audit entry take over the result dicts;
+            only pass True once the caller no longer needs their output
+    """
+    # Checked before the per-host mapping is built, so disabled auditing
+    # costs nothing per host
+    if not is_audit_enabled():
+        return
+    
+    host_aliases = [r['host'] for r in results]
+    log_command_execution(
+        command_type=command_type,
+        hosts=hosts if hosts is not None else host_aliases,
+        command=command,
+        results=dict(zip(host_aliases, results)),
+        metadata=metadata,
+        results_can_mutate=results_can_mutate
+    )
+
+
+def _index_path(log_path: Path) -> Path:
+    """Path of the sidecar offset index for a log file."""
+    return log_path.with_name(log_path.name + ".idx")
+
+
+def _backup_path(log_path: Path, number: int) -> Path:
+    """Path of the numbered rotated copy of a log file."""
+    return log_path.with_name(f"{log_path.name}.{number}")
+
+
+def _audit_log_files() -> List[Path]:
+    """The live audit log followed by its rotated backups, newest first."""
+    files = [AUDIT_LOG_FILE] + [_backup_path(AUDIT_LOG_FILE, n) for n in range(1, AUDIT_LOG_BACKUPS + 1)]
+    return [path for path in files if path.exists()]
+
+
+def _needs_rotation(log_path: Path, incoming: int) -> bool:
+    """Check whether writing incoming bytes would push the log past the size limit."""
+    max_size = _audit_max_size()
+    try:
+        size = log_path.stat().st_size
+    except FileNotFoundError:
+        return False
+    return max_size > 0 and size > 0 and size + incoming > max_size
+
+
+def _rotate(log_path: Path):
+    """Shift the log and its index to numbered backups, dropping the oldest."""
+    for number in range(AUDIT_LOG_BACKUPS, 0, -1):
+        source = log_path if number == 1 else _backup_path(log_path, number - 1)
+        target = _backup_path(log_path, number)
+        for src, dst in ((source, target), (_index_path(source), _index_path(target))):
+            if src.exists():
+                os.replace(src, dst)
+
+
+def _index_end(index_path: Path) -> int:
+    """Return the log offset just past the last indexed line, or -1 if the index is unusable."""
+    try:
+        with open(index_path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size % _INDEX_RECORD.size:
+                return -1
+            if size == 0:
+                return 0
+            f.seek(size - _INDEX_RECORD.size)
+            _, offset, length = _INDEX_RECORD.unpack(f.read(_INDEX_RECORD.size))
+            return offset + length
+    except FileNotFoundError:
+        return 0
+
+
+def _append_index_records(log_path: Path, records: List[Tuple[int, int, int]]):
+    """
+    Append (unix_time, offset, length) records for new lines to the sidecar index.
+    
+    Records are only written when the index covers the log exactly up to
+    the first new line; otherwise the index is left stale and rebuilt on the
+    next query.
+    """
+    index_path = _index_path(log_path)
+    try:
+        if _index_end(index_path) != records[0][1]:
+            return
+        with open(index_path, 'ab') as f:
+            f.write(b''.join(_INDEX_RECORD.pack(*record) for record in records))
+    except OSError:
+        pass
+
+
+class _AuditWriter:
+    """
+    Background appender for audit log lines.
+    
+    Entries queued within one flush interval are written with a single
+    os.write() on an O_APPEND descriptor that stays open between batches,
+    and their index records appended together. The thread starts on first
+    use and is drained at interpreter exit.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+        self._fd_path: Optional[Path] = None
+
+    def enqueue(self, log_path: Path, unix_time: int, line: bytes):
+        """Queue one encoded log line for writing."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="remotex-audit", daemon=True)
+                self._thread.start()
+        self._queue.put((log_path, unix_time, line))
+
+    def flush(self):
+        """Block until every queued entry has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Write any queued entries and stop the background thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+        if self._fd is not None:
+            try:
+                os.fsync(self._fd)
+            except OSError:
+                pass
+            self._close_fd()
+
+    def _close_fd(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._fd_path = None
+
+    def _log_fd(self, log_path: Path) -> int:
+        """Return an append descriptor for the log, reopening it if the file was replaced."""
+        if self._fd is not None:
+            try:
+                current = os.stat(log_path)
+                opened = os.fstat(self._fd)
+                if log_path == self._fd_path and (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino):
+                    return self._fd
+            except OSError:
+                pass
+            self._close_fd()
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        self._fd = os.open(log_path, flags, 0o600)
+        self._fd_path = log_path
+        return self._fd
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + _FLUSH_INTERVAL
+            while not stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+            try:
+                self._write(batch)
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+            if stopping:
+                return
+
+    def _write(self, batch: List):
+        by_path: Dict[Path, List] = {}
+        for log_path, unix_time, line in batch:
+            by_path.setdefault(log_path, []).append((unix_time, line))
+
+        for log_path, entries in by_path.items():
+            data = b''.join(line for _, line in entries)
+            try:
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                if _needs_rotation(log_path, len(data)):
+                    # Windows cannot rename a file that is still open
+                    self._close_fd()
+                    _rotate(log_path)
+            except OSError:
+                # A failed rotation just lets the current log grow
+                pass
+            try:
+                fd = self._log_fd(log_path)
+                offset = os.lseek(fd, 0, os.SEEK_END)
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            except OSError:
+                # Auditing must never break the command being audited
+                continue
+            records = []
+            for unix_time, line in entries:
+                records.append((unix_time, offset, len(line)))
+                offset += len(line)
+            _append_index_records(log_path, records)
+
+
+_writer = _AuditWriter()
+atexit.register(_writer.close)
+
+
+def _rebuild_index(log_path: Path, index_path: Path):
+    """Rewrite the sidecar index from a full scan of the log."""
+    records = bytearray()
+    unix_time = 0
+    offset = 0
+    with open(log_path, 'rb') as f:
+        for line in f:
+            try:
+                entry = _loads(line)
+                if "unix_time" in entry:
+                    unix_time = int(entry["unix_time"])
+                else:
+                    unix_time = _since_to_unix(entry.get("timestamp", "")) or unix_time
+            except (ValueError, TypeError, AttributeError):
+                # Corrupt lines keep the previous time so the index stays sorted
+                pass
+            records += _INDEX_RECORD.pack(unix_time, offset, len(line))
+            offset += len(line)
+    
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.write_bytes(bytes(records))
+    os.replace(tmp_path, index_path)
+
+
+def _since_to_unix(since: str) -> Optional[int]:
+    """Convert an ISO 8601 since filter to a unix time, or None if it does not parse."""
+    try:
+        cutoff = datetime.fromisoformat(since[:-1] if since.endswith("Z") else since)
+    except ValueError:
+        return None
+    if cutoff.tzinfo is None:
+        cutoff = cutoff.replace(tzinfo=timezone.utc)
+    return int(cutoff.timestamp())
+
+
+def _since_offset(log_path: Path, since_time: int) -> int:
+    """
+    Find the log offset of the first entry logged at or after since_time.
+    
+    Bisects the memory-mapped sidecar index, rebuilding it first if it does
+    not cover the whole log. Falls back to 0 (scan everything) on errors.
+    """
+    index_path = _index_path(log_path)
+    try:
+        if _index_end(index_path) != log_path.stat().st_size:
+            _rebuild_index(log_path, index_path)
+        with open(index_path, 'rb') as f:
+            count = f.seek(0, os.SEEK_END) // _INDEX_RECORD.size
+            if count == 0:
+                return 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index:
+                lo, hi = 0, count
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if _INDEX_RECORD.unpack_from(index, mid * _INDEX_RECORD.size)[0] < since_time:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                if lo == count:
+                    _, offset, length = _INDEX_RECORD.unpack_from(index, (count - 1) * _INDEX_RECORD.size)
+                    return offset + length
+                return _INDEX_RECORD.unpack_from(index, lo * _INDEX_RECORD.size)[1]
+    except (OSError, ValueError):
+        return 0
+
+
+def _iter_lines_reversed(path: Path, start: int = 0) -> Iterator[bytes]:
+    """
+    Yield the non-empty lines of a file from last to first, reading backwards in blocks.
+    
+    Large files are memory-mapped and split with rfind instead, which avoids
+    copying every block through a read buffer.
+    
+    Args:
+        path: File to read
+        start: Offset of the first line to include; nothing before it is read
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        if pos >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                end = pos
+                while end > start:
+                    newline = mapped.rfind(b'\n', start, end)
+                    line = mapped[newline + 1:end] if newline != -1 else mapped[start:end]
+                    if line.strip():
+                        yield line
+                    if newline == -1:
+                        break
+                    end = newline
+            return
+        
+        remainder = b''
+        while pos > start:
+            read_size = min(_TAIL_BLOCK_SIZE, pos - start)
+            pos -= read_size
+            f.seek(pos)
+            lines = (f.read(read_size) + remainder).split(b'\n')
+            # The first piece may be the tail of a line that starts in an earlier block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
+
+
+def _scan_plan(since_time: Optional[int] = None) -> List[Tuple[Path, int]]:
+    """
+    List the (file, start offset) pairs to read, live log first, then backups.
     
-    # Append to audit log
-    with open(AUDIT_LOG_FILE, 'a') as f:
-        f.write(json.dumps(audit_entry) + "\n")
+    With since_time, each file is only read down to the first entry at or
+    after the cutoff, and older backups are skipped once a file's cutoff
+    falls inside it.
+    """
+    plan = []
+    for path in _audit_log_files():
+        start = _since_offset(path, since_time) if since_time is not None else 0
+        plan.append((path, start))
+        if start > 0:
+            break
+    return plan
+
+
+def _iter_log_lines_reversed(since_time: Optional[int] = None) -> Iterator[bytes]:
+    """Yield lines from the live log and then its backups, newest first."""
+    for path, start in _scan_plan(since_time):
+        yield from _iter_lines_reversed(path, start)
+
+
+def _loads(line: bytes) -> Dict:
+    """Parse one audit log line, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _dumps(entry: Dict) -> bytes:
+    """Encode one audit entry as a single JSON line, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(entry).encode('utf-8')
+
+
+def _line_timestamp(line: bytes) -> Optional[bytes]:
+    """Pull the timestamp value out of a raw log line without parsing the JSON."""
+    key = line.find(b'"timestamp":')
+    if key == -1:
+        return None
+    start = line.find(b'"', key + len(b'"timestamp":'))
+    end = line.find(b'"', start + 1) if start != -1 else -1
+    if end == -1:
+        return None
+    return line[start + 1:end]
+
+
+def _json_string_forms(value: str) -> Tuple[bytes, ...]:
+    """The ways a string can appear in a log line: ASCII-escaped (json) or raw UTF-8 (orjson)."""
+    return tuple({
+        json.dumps(value).encode('utf-8'),
+        json.dumps(value, ensure_ascii=False).encode('utf-8'),
+    })
+
+
+def _matches_filters(
+    entry: Dict,
+    user: Optional[str],
+    command_type: Optional[str],
+    host: Optional[str],
+    since_time: Optional[int]
+) -> bool:
+    """
+    Check a decoded audit entry against the search filters.
+    
+    since_time is the since filter as a unix time, parsed once per search.
+    Entries without unix_time pass it here; their raw timestamp was already
+    compared before the line was parsed.
+    """
+    if user and entry.get("user") != user:
+        return False
+    if command_type and entry.get("command_type") != command_type:
+        return False
+    if host and host not in entry.get("hosts", []):
+        return False
+    if since_time is not None and entry.get("unix_time", since_time) < since_time:
+        return False
+    return True
 
 
 def get_recent_audit_entries(count: int = 20) -> List[Dict]:
-    """Get recent audit log entries."""
-    if not AUDIT_LOG_FILE.exists():
+    """
+    Get recent audit log entries.
+    
+    The log is read backwards from the end, so the cost depends on count
+    rather than on the size of the log.
+    """
+    _writer.flush()
+    if count <= 0:
         return []
     
     entries = []
-    with open(AUDIT_LOG_FILE, 'r') as f:
-        for line in f:
-            try:
-                entries.append(json.loads(line.strip()))
-            except json.JSONDecodeError:
-                continue
+    for line in _iter_log_lines_reversed():
+        try:
+            entries.append(_loads(line))
+        except json.JSONDecodeError:
+            continue
+        if len(entries) == count:
+            break
+    
+    # Oldest first, matching the order in the log
+    entries.reverse()
+    return entries
+
+
+def _search_plan(
+    user: Optional[str],
+    command_type: Optional[str],
+    host: Optional[str],
+    since: Optional[str]
+) -> Tuple[List[Tuple[Path, int]], Tuple, bool]:
+    """
+    Work out which files a search scans and whether to scan them in parallel.
     
-    # Return most recent entries
-    return entries[-count:]
+    Returns:
+        Tuple of (scan plan, filters for _search_file, parallel)
+    """
+    _writer.flush()
+    since_time = _since_to_unix(since) if since else None
+    plan = _scan_plan(since_time)
+    filters = (user, command_type, host, since, since_time)
+    parallel = len(plan) > 1 and sum(path.stat().st_size - start for path, start in plan) >= _PARALLEL_SCAN_THRESHOLD
+    return plan, filters, parallel
 
 
 def search_audit_log(
@@ -105,31 +640,191 @@ def search_audit_log(
     since: Optional[str] = None,
     limit: int = 50
 ) -> List[Dict]:
-    """Search audit log with filters."""
-    if not AUDIT_LOG_FILE.exists():
+    """
+    Search audit log with filters.
+    
+    The log is scanned from the newest entry backwards and the scan stops
+    once limit matches are found. With since, the sidecar index bounds the
+    scan to entries logged after the cutoff. Lines that cannot match (older
+    than since, or missing a filter value in the raw bytes) are rejected
+    without being parsed.
+    """
+    if limit <= 0:
+        _writer.flush()
         return []
     
-    entries = []
-    with open(AUDIT_LOG_FILE, 'r') as f:
-        for line in f:
-            try:
-                entry = json.loads(line.strip())
-                
-                # Apply filters
-                if user and entry.get("user") != user:
-                    continue
-                if command_type and entry.get("command_type") != command_type:
-                    continue
-                if host and host not in entry.get("hosts", []):
-                    continue
-                if since:
-                    # Simple timestamp comparison
-                    if entry.get("timestamp", "") < since:
-                        continue
-                
-                entries.append(entry)
-            except json.JSONDecodeError:
+    plan, filters, parallel = _search_plan(user, command_type, host, since)
+    
+    parts: Optional[List[List[Dict]]] = None
+    if parallel:
+        try:
+            parts = _search_files_parallel(plan, filters, limit, _search_file, len)
+        except (OSError, BrokenProcessPool):
+            # No usable worker processes here; scan in this process instead
+            parts = None
+    
+    entries: List[Dict] = []
+    if parts is not None:
+        for part in parts:
+            entries.extend(part[:limit - len(entries)])
+    else:
+        for path, start in plan:
+            entries.extend(_search_file(path, start, filters, limit - len(entries)))
+            if len(entries) >= limit:
+                break
+    
+    # Most recent matching entries, oldest first
+    entries.reverse()
+    return entries
+
+
+class AuditColumns(NamedTuple):
+    """Audit search results stored column by column, oldest first."""
+    timestamps: List[str]
+    unix_times: array  # array('q')
+    users: List[str]
+    command_types: List[str]
+    commands: List[str]
+    host_counts: array  # array('l')
+    succeeded: array  # array('l')
+
+
+def _empty_columns() -> AuditColumns:
+    """Create AuditColumns with no rows."""
+    return AuditColumns([], array('q'), [], [], [], array('l'), array('l'))
+
+
+def _add_to_columns(columns: AuditColumns, entry: Dict):
+    """Copy an entry's summary fields onto the end of columns."""
+    columns.timestamps.append(entry.get("timestamp", ""))
+    columns.unix_times.append(int(entry.get("unix_time", 0)))
+    columns.users.append(entry.get("user", ""))
+    columns.command_types.append(entry.get("command_type", ""))
+    columns.commands.append(entry.get("command", ""))
+    columns.host_counts.append(int(entry.get("host_count", len(entry.get("hosts", [])))))
+    columns.succeeded.append(int(entry.get("summary", {}).get("succeeded", 0)))
+
+
+def _columns_length(columns: AuditColumns) -> int:
+    """Count the rows held in columns."""
+    return len(columns.timestamps)
+
+
+def search_audit_log_columns(
+    user: Optional[str] = None,
+    command_type: Optional[str] = None,
+    host: Optional[str] = None,
+    since: Optional[str] = None,
+    limit: int = 50
+) -> AuditColumns:
+    """
+    Search the audit log and return the matches as columns.
+    
+    Takes the same filters as search_audit_log(). Each matching entry's
+    summary fields are copied into the columns during the scan and the dict
+    is dropped straight away, with the numeric fields packed into typed
+    arrays, so large reports never hold a list of entry dicts.
+    """
+    columns = _empty_columns()
+    if limit <= 0:
+        _writer.flush()
+        return columns
+    
+    plan, filters, parallel = _search_plan(user, command_type, host, since)
+    
+    parts: Optional[List[AuditColumns]] = None
+    if parallel:
+        try:
+            parts = _search_files_parallel(plan, filters, limit, _search_file_columns, _columns_length)
+        except (OSError, BrokenProcessPool):
+            # No usable worker processes here; scan in this process instead
+            parts = None
+    
+    if parts is not None:
+        for part in parts:
+            wanted = limit - _columns_length(columns)
+            for column, values in zip(columns, part):
+                column.extend(values[:wanted])
+    else:
+        for path, start in plan:
+            for entry in islice(_iter_matches(path, start, filters), limit - _columns_length(columns)):
+                _add_to_columns(columns, entry)
+            if _columns_length(columns) >= limit:
+                break
+    
+    # Scanned newest first; reported oldest first
+    for column in columns:
+        column.reverse()
+    return columns
+
+
+def _iter_matches(path: Path, start: int, filters: Tuple) -> Iterator[Dict]:
+    """Yield the entries of one log file that match filters, newest first."""
+    user, command_type, host, since, since_time = filters
+    since_bytes = since.encode('utf-8') if since else None
+    
+    # Each filter value must appear as a JSON string somewhere in a matching line
+    required = [_json_string_forms(value) for value in (user, command_type, host) if value]
+    
+    for line in _iter_lines_reversed(path, start):
+        if since_bytes:
+            timestamp = _line_timestamp(line)
+            if timestamp is not None and timestamp < since_bytes:
                 continue
+        if not all(any(form in line for form in forms) for forms in required):
+            continue
+        try:
+            entry = _loads(line)
+        except json.JSONDecodeError:
+            continue
+        if _matches_filters(entry, user, command_type, host, since_time):
+            yield entry
+
+
+def _search_file(path: Path, start: int, filters: Tuple, limit: int) -> List[Dict]:
+    """
+    Scan one log file backwards from its end down to start.
+    
+    Returns up to limit matching entries, newest first. Runs in worker
+    processes for parallel searches, so it only takes picklable arguments.
+    """
+    return list(islice(_iter_matches(path, start, filters), limit))
+
+
+def _search_file_columns(path: Path, start: int, filters: Tuple, limit: int) -> AuditColumns:
+    """Like _search_file, but returns the matches as columns, newest first."""
+    columns = _empty_columns()
+    for entry in islice(_iter_matches(path, start, filters), limit):
+        _add_to_columns(columns, entry)
+    return columns
+
+
+def _search_files_parallel(
+    plan: List[Tuple[Path, int]],
+    filters: Tuple,
+    limit: int,
+    scan: Callable,
+    size: Callable
+) -> list:
+    """
+    Run scan on each planned file in its own worker process.
     
-    # Return most recent matching entries
-    return entries[-limit:]
+    Returns each file's matches in plan order, so merging them matches a
+    serial scan; size counts the matches in one file's result. Files not
+    yet started are cancelled once limit matches are collected.
+    """
+    parts = []
+    found = 0
+    workers = min(len(plan), os.cpu_count() or 1)
+    # spawn, not fork: the audit writer and command threads may be running
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(scan, path, start, filters, limit) for path, start in plan]
+        for future in futures:
+            parts.append(future.result())
+            found += size(parts[-1])
+            if found >= limit:
+                for pending in futures:
+                    pending.cancel()
+                break
+    return parts
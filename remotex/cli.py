@@ -4,26 +4,105 @@ RemoteX CLI Entry Point
 Main command-line interface for RemoteX SSH server management tool.
 """
 
-import logging
+import importlib
+import os
 import sys
-from typing import Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import typer
+import typer.main
+from typer.core import TyperCommand, TyperGroup
 from rich.console import Console
 
-from remotex import __version__
-from remotex.commands.server_management import register_server_commands
-from remotex.commands.exec_command import register_exec_command
-from remotex.commands.connect_command import register_connect_command
-from remotex.commands.bulk_operations import register_bulk_commands
-from remotex.commands.quick_commands import register_quick_commands
-from remotex.commands.config_command import register_config_command
-from remotex.commands.group_management import register_group_commands
-from remotex.commands.alias_management import register_alias_commands
-from remotex.commands.file_transfer import register_file_transfer_commands
-from remotex.commands.history_command import app as history_app
-from remotex.commands.tunnel_command import app as tunnel_app
-from remotex.commands.profiling_command import app as profile_app
+from remotex import __author__, __description__, __url__, __version__
+
+
+class CommandSpec(NamedTuple):
+    """Static description of a subcommand, resolved to its module on first use."""
+    name: str
+    help: str
+    module_path: str
+    func_name: str  # register_* function, or a typer.Typer sub-app attribute
+
+
+# Listed up front so --help and shell completion never import command modules
+COMMAND_SPECS: List[CommandSpec] = [
+    CommandSpec("list", "List all configured servers from SSH config.", "remotex.commands.server_management", "register_server_commands"),
+    CommandSpec("add", "Add a new server to SSH config.", "remotex.commands.server_management", "register_server_commands"),
+    CommandSpec("info", "Show detailed information about a server.", "remotex.commands.server_management", "register_server_commands"),
+    CommandSpec("edit", "Edit an existing server configuration.", "remotex.commands.server_management", "register_server_commands"),
+    CommandSpec("remove", "Remove a server from SSH config.", "remotex.commands.server_management", "register_server_commands"),
+    CommandSpec("exec", "Execute a command on a remote server and print the output.", "remotex.commands.exec_command", "register_exec_command"),
+    CommandSpec("connect", "Open an interactive shell session on a remote server.\nSupports PTY for interactive commands like top, htop, vim, etc.", "remotex.commands.connect_command", "register_connect_command"),
+    CommandSpec("exec-all", "Execute a command on ALL configured servers in parallel.", "remotex.commands.bulk_operations", "register_bulk_commands"),
+    CommandSpec("exec-multi", "Execute a command on specific servers (comma-separated list).", "remotex.commands.bulk_operations", "register_bulk_commands"),
+    CommandSpec("exec-group", "Execute a command on all servers in a group.", "remotex.commands.bulk_operations", "register_bulk_commands"),
+    CommandSpec("uptime", "Quick uptime check.", "remotex.commands.quick_commands", "register_quick_commands"),
+    CommandSpec("disk", "Quick disk usage check.", "remotex.commands.quick_commands", "register_quick_commands"),
+    CommandSpec("memory", "Quick memory usage check.", "remotex.commands.quick_commands", "register_quick_commands"),
+    CommandSpec("cpu", "Quick CPU info.", "remotex.commands.quick_commands", "register_quick_commands"),
+    CommandSpec("processes", "Quick process list.", "remotex.commands.quick_commands", "register_quick_commands"),
+    CommandSpec("restart", "Quick service restart.", "remotex.commands.quick_commands", "register_quick_commands"),
+    CommandSpec("status", "Quick service status check.", "remotex.commands.quick_commands", "register_quick_commands"),
+    CommandSpec("logs", "Quick log viewing.", "remotex.commands.quick_commands", "register_quick_commands"),
+    CommandSpec("push", "Push (upload) files to a remote server using SFTP.", "remotex.commands.file_transfer", "register_file_transfer_commands"),
+    CommandSpec("pull", "Pull (download) files from a remote server using SFTP.", "remotex.commands.file_transfer", "register_file_transfer_commands"),
+    CommandSpec("config", "Manage RemoteX configuration", "remotex.commands.config_command", "register_config_command"),
+    CommandSpec("group", "Manage server groups", "remotex.commands.group_management", "register_group_commands"),
+    CommandSpec("alias", "Manage command aliases", "remotex.commands.alias_management", "register_alias_commands"),
+    CommandSpec("history", "Manage command history", "remotex.commands.history_command", "app"),
+    CommandSpec("tunnel", "Manage SSH tunnels", "remotex.commands.tunnel_command", "app"),
+    CommandSpec("profile", "Performance profiling tools", "remotex.commands.profiling_command", "app"),
+]
+_SPECS_BY_NAME: Dict[str, CommandSpec] = {spec.name: spec for spec in COMMAND_SPECS}
+
+# Resolved commands per (module_path, func_name), filled on first dispatch
+_resolved_commands: Dict[Tuple[str, str], Dict[str, TyperCommand]] = {}
+
+
+def _register_spec(app: typer.Typer, spec: CommandSpec):
+    """Register every command provided by a spec's module on an app."""
+    target = getattr(importlib.import_module(spec.module_path), spec.func_name)
+    if isinstance(target, typer.Typer):
+        app.add_typer(target)
+    else:
+        target(app)
+
+
+def _resolve_spec(spec: CommandSpec) -> TyperCommand:
+    """Import a spec's module and return its real command, cached per module."""
+    key = (spec.module_path, spec.func_name)
+    if key not in _resolved_commands:
+        module_app = typer.Typer()
+        _register_spec(module_app, spec)
+        _resolved_commands[key] = typer.main.get_group(module_app).commands
+    return _resolved_commands[key][spec.name]
+
+
+class LazyCommandGroup(TyperGroup):
+    """
+    Root command group that only imports a subcommand's module when it runs.
+    
+    Listing (for --help and completion) returns lightweight placeholders built
+    from COMMAND_SPECS; resolve_command swaps in the real command on dispatch.
+    """
+    
+    def list_commands(self, ctx) -> List[str]:
+        names = list(super().list_commands(ctx))
+        return names + [spec.name for spec in COMMAND_SPECS if spec.name not in self.commands]
+    
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _SPECS_BY_NAME:
+            command = TyperCommand(cmd_name, help=_SPECS_BY_NAME[cmd_name].help)
+        return command
+    
+    def resolve_command(self, ctx, args):
+        cmd_name, command, rest = super().resolve_command(ctx, args)
+        if cmd_name not in self.commands and cmd_name in _SPECS_BY_NAME:
+            command = _resolve_spec(_SPECS_BY_NAME[cmd_name])
+        return cmd_name, command, rest
+
 
 console = Console()
 
@@ -33,6 +112,7 @@ app = typer.Typer(
     help="🚀 RemoteX - Manage SSH servers and execute commands remotely",
     add_completion=True,  # Enable shell completion
     rich_markup_mode="rich",
+    cls=LazyCommandGroup,
 )
 
 # Global state for verbose/debug modes
@@ -46,7 +126,6 @@ global_state = GlobalState()
 def version_callback(value: bool):
     """Handle --version flag."""
     if value:
-        from remotex import __author__, __description__, __url__
         console.print(f"[bold cyan]RemoteX[/bold cyan] v[bold]{__version__}[/bold]")
         console.print()
         console.print(__description__)
@@ -74,7 +153,9 @@ def main_callback(
     global_state.verbose = verbose
     global_state.debug = debug
     
-    # Configure logging
+    # Configure logging (imported here so plain invocations skip the module)
+    if debug or verbose:
+        import logging
     if debug:
         logging.basicConfig(
             level=logging.DEBUG,
@@ -90,13 +171,11 @@ def main_callback(
 @app.command(name="version")
 def version_command():
     """Show version information."""
-    from remotex import __author__, __description__
-    
     console.print(f"\n[bold cyan]RemoteX[/bold cyan] v[bold]{__version__}[/bold]\n")
     console.print(f"[dim]{__description__}[/dim]\n")
     console.print(f"[dim]Author: {__author__}[/dim]")
     console.print(f"[dim]License: MIT[/dim]")
-    console.print(f"[dim]Repository: https://github.com/sagarmemane135/remotex[/dim]\n")
+    console.print(f"[dim]Repository: {__url__}[/dim]\n")
 
 
 @app.command(name="examples")
@@ -142,19 +221,13 @@ def examples_command():
     console.print(examples)
 
 
-# Register all command modules
-register_server_commands(app)
-register_exec_command(app)
-register_connect_command(app)
-register_bulk_commands(app)
-register_quick_commands(app)
-register_config_command(app)
-register_group_commands(app)
-register_alias_commands(app)
-register_file_transfer_commands(app)
-app.add_typer(history_app)
-app.add_typer(tunnel_app)
-app.add_typer(profile_app)
+# REMOTEX_EAGER=1 imports and registers every command up front (for debugging)
+if os.getenv("REMOTEX_EAGER", "").lower() in ("1", "true", "yes", "on"):
+    registered = set()
+    for spec in COMMAND_SPECS:
+        if (spec.module_path, spec.func_name) not in registered:
+            registered.add((spec.module_path, spec.func_name))
+            _register_spec(app, spec)
 
 
 def main():
@@ -6,7 +6,6 @@ Define and execute reusable command aliases
 import typer
 from rich.console import Console
 from rich.table import Table
-from typing import Optional
 
 from remotex import config
 
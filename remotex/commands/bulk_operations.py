@@ -3,24 +3,174 @@ Bulk Operations Module
 Execute commands on multiple servers in parallel.
 """
 
-import asyncio
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import atexit
+import csv
+import io
+import json
+import multiprocessing
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+from typing import Callable, List, Dict, NamedTuple, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 
 import typer
-import paramiko
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.text import Text
 from rich import box
-from rich.live import Live
 
-from remotex.ssh_config import get_all_hosts, parse_ssh_config
-from remotex.ssh_client import create_ssh_client
-from remotex.history import add_to_history
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from remotex.config import get_ssh_backend
+from remotex.ssh_config import get_all_hosts, parse_ssh_config, parse_ssh_configs
+from remotex.ssh_backend import BACKEND_ASYNCSSH, BACKEND_AUTO, BACKEND_CONTROLMASTER, run_via_controlmaster
+from remotex.ssh_client import run_command
+from remotex.ssh_pool import PREWARM_PARALLEL, pool, prewarm_connections
+from remotex.history import record_history
+from remotex.performance import cache_data, get_cached_data
+from remotex.retry import retry_with_backoff
 
 console = Console()
+# Diagnostics go to stderr so they never mix into --json/--csv on stdout
+err_console = Console(stderr=True)
+
+# Flattens line breaks and tabs so a preview stays on one table row
+_PREVIEW_TABLE = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+# Flattens line breaks so each host stays on one CSV row
+_CSV_TABLE = str.maketrans({'\n': ' ', '\r': ' '})
+
+# Characters of output shown per host in the summary table
+SUMMARY_PREVIEW_WIDTH = 150
+
+# Above this many hosts the summary is printed as compact lines; laying out
+# a rich Table costs far more per row than a line of text
+SUMMARY_TABLE_MAX_HOSTS = 500
+
+# Status cells parsed once and shared by every row of the summary table
+_STATUS_OK = Text.from_markup("[green]✓ Success[/green]")
+_STATUS_FAIL = Text.from_markup("[red]✗ Failed[/red]")
+
+# Cache entry with each host's average command duration, used to start slow
+# hosts first; kept for a week after the last bulk run
+HOST_DURATIONS_CACHE = "host_durations"
+HOST_DURATIONS_TTL = 7 * 24 * 3600
+
+# Fewest hosts worth spreading over worker processes with --crypto-parallel;
+# below this, starting the processes costs more than it saves
+CRYPTO_PARALLEL_MIN_HOSTS = 64
+
+# Default per-host cap on kept output, so one chatty host cannot exhaust memory.
+# Results cut by the cap carry 'truncated': True
+MAX_OUTPUT_BYTES = 1024 * 1024
+
+
+
+class BulkResult(NamedTuple):
+    """Results of one bulk run in host order, with counts tallied as they completed."""
+    results: List[Dict]
+    success_count: int
+    failed_count: int
+
+
+# Worker pool reused across bulk runs in the same process, sized to --parallel
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_size = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(parallel: int) -> ThreadPoolExecutor:
+    """
+    Return the shared worker pool, replacing it if --parallel changed.
+    
+    Keeping the pool between runs lets scripted or library callers that run
+    several bulk commands reuse the worker threads instead of starting new
+    ones each time. The size always equals parallel, so it still caps
+    concurrency.
+    """
+    global _executor, _executor_size
+    with _executor_lock:
+        if _executor is None or _executor_size != parallel:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="remotex")
+            _executor_size = parallel
+        return _executor
+
+
+# Progress display shared by every bulk run in the process, and the number
+# of runs currently showing a task on it
+_progress = None
+_progress_tasks = 0
+_progress_lock = threading.Lock()
+
+
+def _start_progress_task(description: str, total: int):
+    """
+    Add a task to the shared progress display, starting the display if idle.
+    
+    Repeated bulk calls in one process (scripts, library use) reuse one
+    Progress object. Its live display only runs while a task is shown, and
+    only on a terminal: while live, rich redirects stdout and stderr
+    through itself, which must not outlast the run, and when stopped on a
+    pipe it writes a stray blank line.
+    
+    Returns:
+        Tuple of (Progress, task id) for advance() and _finish_progress_task()
+    """
+    global _progress, _progress_tasks
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    
+    with _progress_lock:
+        if _progress is None:
+            _progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+                transient=True,
+                # advance() only bumps a counter; the bar is redrawn by Rich's
+                # refresh thread at this rate no matter how quickly hosts complete
+                refresh_per_second=10
+            )
+        if _progress_tasks == 0 and console.is_terminal:
+            _progress.start()
+        _progress_tasks += 1
+        return _progress, _progress.add_task(description, total=total)
+
+
+def _finish_progress_task(task):
+    """Remove a run's task, stopping the live display once no run is left."""
+    global _progress_tasks
+    
+    with _progress_lock:
+        _progress.remove_task(task)
+        _progress_tasks -= 1
+        if _progress_tasks == 0:
+            if _progress.live.is_started:
+                _progress.stop()
+        else:
+            # Redraw now so the finished bar is not repainted under later output
+            _progress.refresh()
+
+
+def _shutdown_executor():
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+
+
+atexit.register(_shutdown_executor)
 
 
 def register_bulk_commands(app: typer.Typer):
@@ -30,50 +180,688 @@ def register_bulk_commands(app: typer.Typer):
     app.command(name="exec-group")(exec_group)
 
 
-def execute_on_host(host_alias: str, command: str, timeout: int = 30, retries: int = 0, verbose: bool = False) -> Dict:
-    """Execute command on a single host and return result."""
-    from remotex.retry import retry_with_backoff
+def execute_on_host(
+    host_alias: str,
+    command: str,
+    timeout: int = 30,
+    retries: int = 0,
+    verbose: bool = False,
+    only_exit_code: bool = False,
+    host_config: Optional[dict] = None,
+    max_output: Optional[int] = None,
+    quiet: bool = False
+) -> Dict:
+    """
+    Execute command on a single host and return result (exit code only if only_exit_code).
     
-    def attempt_execution():
-        result = {
-            'host': host_alias,
-            'success': False,
-            'output': '',
-            'error': '',
-            'exit_code': -1
-        }
-        
-        try:
+    host_config may carry the host's pre-resolved SSH config so bulk runs
+    skip the per-host lookup; it is looked up here when not given. With
+    max_output only the last max_output bytes of output and error are kept,
+    and the result gets 'truncated': True when anything was cut. quiet
+    suppresses the connection error panel; the failure is still
+    reported in the result.
+    """
+    if get_ssh_backend() == BACKEND_CONTROLMASTER:
+        run, args = run_via_controlmaster, (host_alias, command, timeout, only_exit_code, max_output)
+    else:
+        run, args = _run_via_paramiko, (host_alias, command, timeout, only_exit_code, host_config, max_output, quiet)
+    
+    # Use retry logic if retries > 0; a single attempt is a plain call
+    if retries > 0:
+        return retry_with_backoff(partial(run, *args), max_retries=retries, verbose=verbose, host=host_alias)
+    return run(*args)
+
+
+def _run_via_paramiko(
+    host_alias: str,
+    command: str,
+    timeout: int,
+    only_exit_code: bool = False,
+    host_config: Optional[dict] = None,
+    max_output: Optional[int] = None,
+    quiet: bool = False
+) -> Dict:
+    """Execute command once over a pooled paramiko connection."""
+    result = {
+        'host': host_alias,
+        'success': False,
+        'output': '',
+        'error': '',
+        'exit_code': -1
+    }
+    
+    try:
+        if host_config is None:
             host_config = parse_ssh_config(host_alias)
-            if not host_config:
-                result['error'] = 'Failed to parse SSH config'
-                return result
-            
-            client = create_ssh_client(host_config)
+        if not host_config:
+            result['error'] = 'Failed to parse SSH config'
+            return result
+        
+        with pool.acquire(host_alias, host_config, quiet=quiet) as client:
             if not client:
                 result['error'] = 'Failed to connect'
                 return result
             
             try:
-                # Command is provided by trusted admin user for their managed infrastructure
-                stdin, stdout, stderr = client.exec_command(command, timeout=timeout)  # nosec B601
-                result['output'] = stdout.read().decode('utf-8', errors='ignore')
-                result['error'] = stderr.read().decode('utf-8', errors='ignore')
-                result['exit_code'] = stdout.channel.recv_exit_status()
-                result['success'] = result['exit_code'] == 0
-            finally:
-                client.close()
-                
+                # One byte over the cap shows whether anything was cut
+                output, error, exit_code = run_command(
+                    client, command, timeout, discard_output=only_exit_code,
+                    max_output=max_output + 1 if max_output else None
+                )
+            except socket.timeout:
+                # Only the command's channel is closed; the authenticated
+                # transport goes back to the pool for the next command
+                result['error'] = f'Command timed out after {timeout}s'
+                return result
+            if max_output and (len(output) > max_output or len(error) > max_output):
+                output, error = output[-max_output:], error[-max_output:]
+                result['truncated'] = True
+            result['output'] = output.decode('utf-8', errors='ignore')
+            result['error'] = error.decode('utf-8', errors='ignore')
+            result['exit_code'] = exit_code
+            result['success'] = exit_code == 0
+    
+    except Exception as e:
+        result['error'] = str(e)
+    
+    return result
+
+
+def _use_async_backend() -> bool:
+    """
+    Check whether bulk fan-out should run on the asyncssh event loop.
+    
+    The default "auto" backend uses it whenever asyncssh is installed, so
+    large fan-outs run on one event loop instead of a thread per connection.
+    """
+    backend = get_ssh_backend()
+    if backend not in (BACKEND_ASYNCSSH, BACKEND_AUTO):
+        return False
+    from remotex import async_exec
+    if backend == BACKEND_AUTO:
+        return async_exec.is_available()
+    if not async_exec.is_available():
+        err_console.print("[yellow]⚠[/yellow] asyncssh is not installed; falling back to the paramiko backend")
+        return False
+    return True
+
+
+def _use_process_shards(host_list: List[str], crypto_parallel: bool) -> bool:
+    """
+    Check whether --crypto-parallel applies to this run.
+    
+    The flag is an explicit request, so it wins over the "auto" backend's
+    asyncssh event loop; runs below CRYPTO_PARALLEL_MIN_HOSTS stay in one
+    process either way.
+    """
+    return crypto_parallel and len(host_list) >= CRYPTO_PARALLEL_MIN_HOSTS
+
+
+def _host_configs(host_list: List[str]) -> Dict[str, Optional[dict]]:
+    """Resolve every host's SSH config in one pass (paramiko backend only)."""
+    if get_ssh_backend() == BACKEND_CONTROLMASTER:
+        return {}
+    return parse_ssh_configs(host_list)
+
+
+def _prewarm(host_list: List[str], parallel: int, host_configs: Dict[str, Optional[dict]]):
+    """
+    Connect to every host up front when there are more hosts than workers.
+
+    With --parallel below the host count, each worker would otherwise pay
+    for its next host's handshake in turn; connecting them all at once
+    leaves only command time on the workers.
+    """
+    if get_ssh_backend() == BACKEND_CONTROLMASTER or len(host_list) <= parallel:
+        return
+    prewarm_connections(host_list, max(parallel, PREWARM_PARALLEL), host_configs)
+
+
+def _longest_first(host_list: List[str], durations: Dict[str, float]) -> List[str]:
+    """
+    Order hosts by their recorded duration, slowest first.
+    
+    Starting the slow hosts first (longest-processing-time scheduling) keeps
+    one long host from running alone at the end of the run while the other
+    workers sit idle. Hosts with no recorded duration go first, since their
+    first run includes a fresh handshake.
+    """
+    return sorted(host_list, key=lambda host: -durations.get(host, float('inf')))
+
+
+def _save_host_durations(measured: Dict[str, float]):
+    """Blend this run's per-host durations into the cached averages."""
+    if not measured:
+        return
+    durations = get_cached_data(HOST_DURATIONS_CACHE) or {}
+    for host, seconds in measured.items():
+        previous = durations.get(host)
+        durations[host] = seconds if previous is None else (previous + seconds) / 2
+    try:
+        cache_data(HOST_DURATIONS_CACHE, durations, ttl=HOST_DURATIONS_TTL)
+    except OSError:
+        pass  # Scheduling hints only; never fail the command
+
+
+def _failed_result(host_alias: str, error: str) -> Dict:
+    """Build the result for a host whose run raised instead of returning."""
+    return {'host': host_alias, 'success': False, 'output': '', 'error': error, 'exit_code': -1}
+
+
+def _timed_execute(measured: Dict[str, float], host_alias: str, *args, **kwargs) -> Dict:
+    """Run execute_on_host and record how long the host took."""
+    started = time.monotonic()
+    try:
+        return execute_on_host(host_alias, *args, **kwargs)
+    finally:
+        measured[host_alias] = time.monotonic() - started
+
+
+def _run_threads(
+    host_list: List[str],
+    command: str,
+    parallel: int,
+    timeout: int,
+    retries: int,
+    only_exit_code: bool,
+    max_output: Optional[int],
+    completed: Callable[[Dict], None],
+    quiet: bool = False
+) -> List[Dict]:
+    """
+    Run every host on the shared worker pool, slowest first.
+    
+    Only twice --parallel hosts are queued on the pool at a time and each
+    completion submits the next one, so the number of pending futures stays
+    bounded by --parallel rather than growing with the host count. completed
+    is called with each result as it finishes, and each host's duration is
+    saved for the next run's ordering. quiet is passed on to execute_on_host.
+    
+    Returns:
+        Results in host_list order
+    """
+    host_configs = _host_configs(host_list)
+    _prewarm(host_list, parallel, host_configs)
+    
+    executor = _get_executor(parallel)
+    measured: Dict[str, float] = {}
+    durations = get_cached_data(HOST_DURATIONS_CACHE) or {}
+    queued = iter(_longest_first(host_list, durations))
+    running: Dict = {}
+    finished: queue.Queue = queue.Queue()
+    results: Dict[str, Dict] = {}
+    
+    def submit_next():
+        host = next(queued, None)
+        if host is not None:
+            future = executor.submit(
+                _timed_execute, measured, host, command, timeout, retries,
+                only_exit_code=only_exit_code, host_config=host_configs.get(host), max_output=max_output,
+                quiet=quiet
+            )
+            running[future] = host
+            future.add_done_callback(finished.put)
+    
+    for _ in range(2 * parallel):
+        submit_next()
+    
+    while running:
+        future = finished.get()
+        host = running.pop(future)
+        try:
+            result = future.result()
+        except Exception as e:
+            # execute_on_host reports failures in the result; this catches
+            # anything that escapes it so one host cannot abort the run
+            result = _failed_result(host, str(e))
+        results[host] = result
+        completed(result)
+        submit_next()
+    
+    _save_host_durations(measured)
+    return [results[host] for host in host_list]
+
+
+def _run_shard(
+    host_list: List[str],
+    command: str,
+    timeout: int,
+    retries: int,
+    only_exit_code: bool,
+    max_output: Optional[int],
+    parallel: int,
+    host_configs: Dict[str, Optional[dict]],
+    quiet: bool = False
+) -> List[Dict]:
+    """Run one worker process's share of the hosts on a local thread pool."""
+    run = partial(
+        execute_on_host, command=command, timeout=timeout, retries=retries,
+        only_exit_code=only_exit_code, max_output=max_output, quiet=quiet
+    )
+    
+    def run_host(host: str) -> Dict:
+        try:
+            return run(host, host_config=host_configs.get(host))
         except Exception as e:
-            result['error'] = str(e)
+            return _failed_result(host, str(e))
+    
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        return list(executor.map(run_host, host_list))
+
+
+def _run_in_processes(
+    host_list: List[str],
+    command: str,
+    parallel: int,
+    timeout: int,
+    retries: int,
+    only_exit_code: bool,
+    max_output: Optional[int],
+    completed: Callable[[Dict], None],
+    quiet: bool = False
+) -> List[Dict]:
+    """
+    Spread the hosts over one worker process per CPU (--crypto-parallel).
+    
+    Paramiko's ciphers and MACs run under the GIL, so with many busy
+    connections a single process saturates one core. Each process runs its
+    share of the hosts on threads, with --parallel divided between them.
+    SSH configs are resolved here once and shipped with each shard, so the
+    workers never read ~/.ssh/config themselves. completed is called with
+    each result as its process finishes.
+    
+    Returns:
+        Results in host_list order
+    """
+    processes = max(1, min(os.cpu_count() or 1, parallel))
+    per_process = -(-parallel // processes)
+    shards = [host_list[i::processes] for i in range(processes)]
+    host_configs = _host_configs(host_list)
+    results: Dict[str, Dict] = {}
+    
+    # spawn, not fork: this process already runs pool, progress and log threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+        futures = {
+            executor.submit(
+                _run_shard, shard, command, timeout, retries, only_exit_code, max_output, per_process,
+                {host: host_configs.get(host) for host in shard}, quiet
+            ): shard
+            for shard in shards if shard
+        }
+        for future in as_completed(futures):
+            try:
+                shard_results = future.result()
+            except (OSError, BrokenProcessPool) as e:
+                shard_results = [_failed_result(host, f'Worker process failed: {e}') for host in futures[future]]
+            for result in shard_results:
+                results[result['host']] = result
+                completed(result)
+    
+    return [results[host] for host in host_list]
+
+
+def _in_host_order(
+    host_list: List[str],
+    callback: Callable[[Dict], None],
+    flush: Optional[Callable[[], None]] = None
+) -> Callable[[Dict], None]:
+    """
+    Wrap callback so it sees results in host_list order.
+    
+    Results that complete ahead of an earlier host are held back until
+    that host finishes, then released together. flush, if given, is called
+    once after each release rather than once per result.
+    """
+    position = {host: index for index, host in enumerate(host_list)}
+    pending: Dict[int, Dict] = {}
+    next_index = 0
+    
+    def deliver(result: Dict):
+        nonlocal next_index
+        pending[position[result['host']]] = result
+        if next_index not in pending:
+            return
+        while next_index in pending:
+            callback(pending.pop(next_index))
+            next_index += 1
+        if flush is not None:
+            flush()
+    
+    return deliver
+
+
+def _execute_without_progress(
+    host_list: List[str],
+    command: str,
+    parallel: int,
+    timeout: int,
+    retries: int,
+    only_exit_code: bool = False,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    max_output: Optional[int] = None,
+    crypto_parallel: bool = False,
+    on_flush: Optional[Callable[[], None]] = None,
+    quiet: bool = False
+) -> BulkResult:
+    """
+    Execute command on all hosts in parallel and collect results.
+    
+    on_result, if given, is called with each result in host_list order as
+    soon as it and every host before it have finished, so output can be
+    written while slower hosts are still running. on_flush is called after
+    each group of results released together. crypto_parallel spreads
+    large runs over worker processes (see _run_in_processes); as an
+    explicit request it takes precedence over the asyncssh backend. quiet
+    keeps connection error panels off stdout, for the streamed report
+    modes.
+    
+    Returns:
+        BulkResult with results in host_list order
+    """
+    deliver = _in_host_order(host_list, on_result, on_flush) if on_result is not None else None
+    succeeded = 0
+    
+    def completed(result: Dict):
+        nonlocal succeeded
+        if result['success']:
+            succeeded += 1
+        if deliver is not None:
+            deliver(result)
+    
+    if _use_process_shards(host_list, crypto_parallel):
+        results = _run_in_processes(
+            host_list, command, parallel, timeout, retries, only_exit_code, max_output, completed, quiet
+        )
+        return BulkResult(results, succeeded, len(results) - succeeded)
+    
+    if _use_async_backend():
+        from remotex.async_exec import run_all
+        results = run_all(
+            host_list, command, parallel, timeout, retries, only_exit_code,
+            on_result=completed, max_output=max_output
+        )
+        return BulkResult(results, succeeded, len(results) - succeeded)
+    
+    # Counted as they complete, returned in host_list order so output order
+    # matches host_list
+    results = _run_threads(
+        host_list, command, parallel, timeout, retries, only_exit_code, max_output, completed, quiet
+    )
+    return BulkResult(results, succeeded, len(results) - succeeded)
+
+
+def _execute_with_progress(
+    host_list: List[str],
+    command: str,
+    parallel: int,
+    timeout: int,
+    retries: int,
+    only_exit_code: bool = False,
+    max_output: Optional[int] = None,
+    crypto_parallel: bool = False,
+    on_result: Optional[Callable[[Dict], None]] = None
+) -> BulkResult:
+    """
+    Execute command on all hosts in parallel with a progress bar.
+    
+    on_result behaves as in _execute_without_progress.
+    
+    Returns:
+        BulkResult with results in host_list order
+    """
+    use_shards = _use_process_shards(host_list, crypto_parallel)
+    use_async = not use_shards and _use_async_backend()
+    deliver = _in_host_order(host_list, on_result) if on_result is not None else None
+    succeeded = 0
+    
+    progress, task = _start_progress_task(f"[cyan]Executing on {len(host_list)} servers...", len(host_list))
+    
+    def completed(result: Dict):
+        nonlocal succeeded
+        if result['success']:
+            succeeded += 1
+        if deliver is not None:
+            deliver(result)
+        progress.advance(task)
+    
+    try:
+        if use_shards:
+            results = _run_in_processes(
+                host_list, command, parallel, timeout, retries, only_exit_code, max_output, completed
+            )
+            return BulkResult(results, succeeded, len(results) - succeeded)
+        
+        if use_async:
+            from remotex.async_exec import run_all
+            results = run_all(
+                host_list, command, parallel, timeout, retries, only_exit_code,
+                on_result=completed, max_output=max_output
+            )
+            return BulkResult(results, succeeded, len(results) - succeeded)
         
-        return result
+        # Progress follows completion order; results keep host_list order
+        results = _run_threads(
+            host_list, command, parallel, timeout, retries, only_exit_code, max_output, completed
+        )
+        return BulkResult(results, succeeded, len(results) - succeeded)
+    finally:
+        _finish_progress_task(task)
+
+
+class _JsonReport:
+    """
+    Writes the --json document to stdout one result at a time.
     
-    # Use retry logic if retries > 0
-    if retries > 0:
-        return retry_with_backoff(attempt_execution, max_retries=retries, verbose=verbose)
-    else:
-        return attempt_execution()
+    The header fields go out before any host runs and each result is
+    written as soon as it is delivered, so the full document is never
+    built in memory. The totals are only known at the end and close the
+    object after the results list.
+    """
+    
+    def __init__(self, header: Dict):
+        self._out = sys.stdout
+        # Encoded bytes go straight to the binary buffer when stdout has one
+        self._buffer = getattr(self._out, 'buffer', None)
+        self._out.flush()
+        self._first = True
+        self._write(b"{\n")
+        for key, value in header.items():
+            encoded = _dumps_indented(value).replace(b"\n", b"\n  ")
+            self._write(b"  " + _dumps_indented(key) + b": " + encoded + b",\n")
+        self._write(b'  "results": [')
+    
+    def _write(self, data: bytes):
+        if self._buffer is not None:
+            self._buffer.write(data)
+        else:
+            self._out.write(data.decode('utf-8'))
+    
+    def write(self, result: Dict):
+        # Worker results already hold exactly the report fields, so they are
+        # encoded as they are. Encoded strings never contain raw newlines,
+        # so re-indenting the lines nests the record inside the results list
+        encoded = _dumps_indented(result).replace(b"\n", b"\n    ")
+        self._write((b"\n    " if self._first else b",\n    ") + encoded)
+        self._first = False
+    
+    def flush(self):
+        self._out.flush()
+    
+    def close(self, total: int, succeeded: int, failed: int):
+        self._write(b"]" if self._first else b"\n  ]")
+        self._write(f',\n  "total": {total},\n  "succeeded": {succeeded},\n  "failed": {failed}\n}}\n'.encode('ascii'))
+        self._out.flush()
+
+
+class _CsvReport:
+    """
+    Writes --csv rows to stdout as results are delivered.
+    
+    Rows are formatted into a local buffer and handed to stdout in one
+    write per group of delivered results; a line-buffered terminal would
+    otherwise get one write per row.
+    """
+    
+    def __init__(self):
+        self._out = sys.stdout
+        csv.writer(self._out).writerow(["Host", "Success", "ExitCode", "Output", "Error"])
+        self._rows = io.StringIO()
+        self._writer = csv.writer(self._rows)
+    
+    def write(self, result: Dict):
+        self._writer.writerow([
+            result['host'], result['success'], result['exit_code'],
+            result['output'].translate(_CSV_TABLE), result['error'].translate(_CSV_TABLE)
+        ])
+    
+    def flush(self):
+        self._out.write(self._rows.getvalue())
+        self._rows.seek(0)
+        self._rows.truncate()
+        self._out.flush()
+
+
+def _dumps_indented(value) -> bytes:
+    """Encode value as two-space indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode('utf-8')
+
+
+def _open_report(json_output: bool, csv_output: bool, header: Dict):
+    """Start the streaming report for --json or --csv, if either was requested."""
+    if json_output:
+        return _JsonReport(header)
+    if csv_output:
+        return _CsvReport()
+    return None
+
+
+def _warn_truncated(results: List[Dict], max_output_bytes: int):
+    """Tell the user on stderr which hosts had output cut by --max-output-bytes."""
+    truncated = [r['host'] for r in results if r.get('truncated')]
+    if truncated:
+        # Text, not markup, so host names are printed literally
+        err_console.print(Text.assemble(
+            ("⚠", "yellow"),
+            f" Output of {len(truncated)} host(s) was cut to the last {max_output_bytes} bytes"
+            f" (--max-output-bytes; 0 keeps everything): {', '.join(truncated[:10])}",
+            " ..." if len(truncated) > 10 else ""
+        ), highlight=False)
+
+
+def _preview(text: str, width: int) -> str:
+    """Return the first width characters of text flattened onto one line."""
+    return text[:width].translate(_PREVIEW_TABLE)
+
+
+def _compact_lines(results: List[Dict]) -> Text:
+    """
+    Build one condensed line per host.
+    
+    Assembled as one Text so no markup is parsed (output previews are
+    shown literally) and it can be rendered in one call.
+    """
+    text = Text()
+    for r in results:
+        text.append("✓ " if r['success'] else "✗ ")
+        text.append(r['host'], style="cyan")
+        text.append(f" [{r['exit_code']}]: {_preview(r['output'] or r['error'], 100)}\n")
+    return text
+
+
+def _output_compact(results: List[Dict], success_count: int):
+    """Print one condensed line per host followed by the success count."""
+    text = _compact_lines(results)
+    text.append(f"\n{success_count}/{len(results)} successful")
+    # The highlighter would otherwise run its regexes over every preview
+    console.print(text, highlight=False)
+
+
+def _output_quiet(results: List[Dict]):
+    """Print one bare status line per host for scripts."""
+    for r in results:
+        status = "✓" if r['success'] else "✗"
+        output = r['output'].strip() or r['error'].strip()
+        print(f"{r['host']}: {status} [{r['exit_code']}] {output}")
+
+
+def _output_plain(results: List[Dict], success_count: int, show_output: bool, heading: str):
+    """Print results as plain text without Rich formatting."""
+    print(f"\n{heading}\n")
+    for r in results:
+        status = "SUCCESS" if r['success'] else "FAILED"
+        print(f"{r['host']}: {status} (exit code: {r['exit_code']})")
+        if show_output and r['output']:
+            print(r['output'])
+        if r['error']:
+            print(f"Error: {r['error']}")
+        print()
+    print(f"Summary: {success_count}/{len(results)} successful")
+
+
+def _handle_output_format(
+    bulk: BulkResult,
+    report,
+    json_output: bool,
+    csv_output: bool,
+    quiet: bool,
+    plain: bool,
+    compact: bool,
+    show_output: bool,
+    heading: str
+) -> bool:
+    """
+    Print results in the first requested lightweight format.
+    
+    The formats are checked in precedence order and only the first one set
+    is printed. heading is the first line of --plain output.
+    
+    Returns:
+        True if a format was printed, False if the formatted view should be shown
+    """
+    results, success_count, failed_count = bulk
+    formatters = (
+        # JSON and CSV results were streamed while running; JSON still needs its totals
+        (json_output, lambda: report.close(len(results), success_count, failed_count)),
+        (csv_output, lambda: None),
+        (quiet, lambda: _output_quiet(results)),
+        (plain, lambda: _output_plain(results, success_count, show_output, heading)),
+        (compact, lambda: _output_compact(results, success_count)),
+    )
+    output = next((formatter for requested, formatter in formatters if requested), None)
+    if output is None:
+        return False
+    output()
+    return True
+
+
+def _summary_table() -> Table:
+    """
+    Create the empty per-host status table.
+    
+    Rows are added with _add_summary_row as hosts finish, so the table is
+    complete when the run ends rather than built in a second pass.
+    """
+    table = Table(title="Execution Summary", box=box.ROUNDED)
+    table.add_column("Server", style="cyan")
+    table.add_column("Status", style="bold")
+    table.add_column("Exit Code", justify="center")
+    table.add_column("Output Preview", style="dim")
+    return table
+
+
+def _add_summary_row(table: Table, result: Dict):
+    """Add one host's status and a one-line output preview to the summary table."""
+    status = _STATUS_OK if result['success'] else _STATUS_FAIL
+    source = result['output'] or result['error']
+    preview = _preview(source, SUMMARY_PREVIEW_WIDTH)
+    if len(source) > SUMMARY_PREVIEW_WIDTH:
+        preview += "..."
+    # Cells are Text so rich never parses remote output as markup; a stray
+    # closing tag in a preview would otherwise fail the whole table
+    table.add_row(Text(result['host']), status, Text(str(result['exit_code'])), Text(preview))
 
 
 def exec_all(
@@ -88,7 +876,16 @@ def exec_all(
     compact: bool = typer.Option(False, "--compact", help="Compact output format"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output for scripting"),
     continue_on_error: bool = typer.Option(True, "--continue/--stop", help="Continue on errors"),
-    show_output: bool = typer.Option(False, "--show-output", help="Show detailed command output")
+    show_output: bool = typer.Option(False, "--show-output", help="Show detailed command output"),
+    no_output: bool = typer.Option(False, "--no-output", help="Only collect exit codes; skip downloading command output"),
+    max_output_bytes: int = typer.Option(
+        MAX_OUTPUT_BYTES, "--max-output-bytes", min=0,
+        help="Keep only the last N bytes of each host's output and errors (default 1 MiB; 0 keeps everything)"
+    ),
+    crypto_parallel: bool = typer.Option(
+        False, "--crypto-parallel",
+        help="Spread large runs over one process per CPU so SSH encryption uses every core (paramiko, even if asyncssh is installed)"
+    )
 ):
     """
     Execute a command on ALL configured servers in parallel.
@@ -105,7 +902,7 @@ def exec_all(
         console.print("[yellow]No servers configured.[/yellow]")
         return
     
-    host_aliases = [h['alias'] for h in hosts]
+    host_aliases = list(dict.fromkeys(h['alias'] for h in hosts))
     
     # Dry-run mode
     if dry_run:
@@ -146,163 +943,49 @@ def exec_all(
         ))
         console.print()
     
-    results = []
-    
-    # Skip progress bars for machine-readable formats
+    # Skip progress bars for machine-readable formats; JSON and CSV are
+    # written host by host while the rest are still running
+    report = None
+    summary = None
     if json_output or csv_output or quiet:
-        with ThreadPoolExecutor(max_workers=parallel) as executor:
-            future_to_host = {
-                executor.submit(execute_on_host, host, command, timeout, retries): host 
-                for host in host_aliases
-            }
-            
-            for future in as_completed(future_to_host):
-                host = future_to_host[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    results.append({
-                        'host': host,
-                        'success': False,
-                        'output': '',
-                        'error': str(e),
-                        'exit_code': -1
-                    })
+        report = _open_report(json_output, csv_output, {"command": command})
+        bulk = _execute_without_progress(
+            host_aliases, command, parallel, timeout, retries, no_output,
+            on_result=report.write if report else None, max_output=max_output_bytes or None,
+            crypto_parallel=crypto_parallel, on_flush=report.flush if report else None, quiet=True
+        )
     else:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task(f"[cyan]Executing on {len(host_aliases)} servers...", total=len(host_aliases))
-            
-            with ThreadPoolExecutor(max_workers=parallel) as executor:
-                future_to_host = {
-                    executor.submit(execute_on_host, host, command, timeout, retries): host 
-                    for host in host_aliases
-                }
-                
-                for future in as_completed(future_to_host):
-                    host = future_to_host[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        progress.update(task, advance=1)
-                    except Exception as e:
-                        results.append({
-                            'host': host,
-                            'success': False,
-                            'output': '',
-                            'error': str(e),
-                            'exit_code': -1
-                        })
-                        progress.update(task, advance=1)
-    
-    # Display results
-    success_count = sum(1 for r in results if r['success'])
-    failed_count = len(results) - success_count
-    
-    # JSON output mode (pure, no decorations)
-    if json_output:
-        import json
-        output_data = {
-            "command": command,
-            "total": len(results),
-            "succeeded": success_count,
-            "failed": failed_count,
-            "results": [
-                {
-                    "host": r['host'],
-                    "success": r['success'],
-                    "exit_code": r['exit_code'],
-                    "output": r['output'],
-                    "error": r['error']
-                }
-                for r in results
-            ]
-        }
-        # Pure JSON output to stdout, bypassing rich console
-        print(json.dumps(output_data, indent=2))
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
-    
-    # CSV output mode (pure, no decorations)
-    if csv_output:
-        import csv
-        import sys
-        writer = csv.writer(sys.stdout)
-        writer.writerow(["Host", "Success", "ExitCode", "Output", "Error"])
-        for r in results:
-            writer.writerow([r['host'], r['success'], r['exit_code'], r['output'].replace('\n', ' '), r['error'].replace('\n', ' ')])
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
-    
-    # Quiet mode (minimal output for scripting)
-    if quiet:
-        for r in results:
-            status = "✓" if r['success'] else "✗"
-            output = r['output'].strip() or r['error'].strip()
-            print(f"{r['host']}: {status} [{r['exit_code']}] {output}")
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
+        # The summary table is filled in host order while the run progresses
+        summary = None if (plain or compact or len(host_aliases) > SUMMARY_TABLE_MAX_HOSTS) else _summary_table()
+        bulk = _execute_with_progress(
+            host_aliases, command, parallel, timeout, retries, no_output, max_output=max_output_bytes or None,
+            crypto_parallel=crypto_parallel, on_result=partial(_add_summary_row, summary) if summary is not None else None
+        )
     
-    # Plain mode (simple text without colors)
-    if plain:
-        print(f"\nExecuting on {len(host_aliases)} servers...\n")
-        for r in results:
-            status = "SUCCESS" if r['success'] else "FAILED"
-            print(f"{r['host']}: {status} (exit code: {r['exit_code']})")
-            if show_output and r['output']:
-                print(r['output'])
-            if r['error']:
-                print(f"Error: {r['error']}")
-            print()
-        print(f"Summary: {success_count}/{len(results)} successful")
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
+    results, success_count, failed_count = bulk
+    _warn_truncated(results, max_output_bytes)
     
-    # Compact mode (condensed output)
-    if compact:
-        for r in results:
-            status = "✓" if r['success'] else "✗"
-            output_preview = (r['output'] or r['error']).replace('\n', ' ')[:100]
-            console.print(f"{status} [cyan]{r['host']}[/cyan] [{r['exit_code']}]: {output_preview}")
-        console.print(f"\n{success_count}/{len(results)} successful")
+    # Lightweight formats print and exit; the formatted view follows otherwise
+    if _handle_output_format(
+        bulk, report,
+        json_output, csv_output, quiet, plain, compact, show_output,
+        heading=f"Executing on {len(host_aliases)} servers..."
+    ):
         if failed_count > 0:
             raise typer.Exit(code=1)
         return
     
     console.print()
     
-    # Summary table
-    table = Table(title="Execution Summary", box=box.ROUNDED)
-    table.add_column("Server", style="cyan")
-    table.add_column("Status", style="bold")
-    table.add_column("Exit Code", justify="center")
-    table.add_column("Output Preview", style="dim")
-    
-    for result in results:
-        status = "[green]✓ Success[/green]" if result['success'] else "[red]✗ Failed[/red]"
-        preview = result['output'][:150].replace('\n', ' ') if result['output'] else result['error'][:150].replace('\n', ' ')
-        table.add_row(
-            result['host'],
-            status,
-            str(result['exit_code']),
-            preview + "..." if len(preview) == 150 else preview
-        )
-    
-    console.print(table)
+    if summary is not None:
+        console.print(summary)
+    else:
+        console.print(_compact_lines(results), highlight=False, end="")
     console.print()
     
-    # Show detailed output if requested
+    # Show detailed output if requested (rendered in a single pass)
     if show_output:
+        panels = []
         for result in results:
             if result['output'] or result['error']:
                 border_style = "green" if result['success'] else "red"
@@ -316,12 +999,14 @@ def exec_all(
                         content += "\n\n[red bold]Errors:[/red bold]\n"
                     content += f"[red]{result['error'].rstrip()}[/red]"
                 
-                console.print(Panel(
+                panels.append(Panel(
                     content,
                     title=title,
                     border_style=border_style,
                     box=box.ROUNDED
                 ))
+        if panels:
+            console.print(Group(*panels))
     
     # Final summary
     summary_text = f"[bold]Total:[/bold] {len(results)} | "
@@ -330,24 +1015,21 @@ def exec_all(
     
     console.print(Panel(summary_text, box=box.ROUNDED))
     
-    # Add to history
-    try:
-        add_to_history(
-            command="exec-all",
-            args=[command],
-            hosts=[r['host'] for r in results],
-            success=(failed_count == 0),
-            metadata={
-                "total": len(results),
-                "succeeded": success_count,
-                "failed": failed_count,
-                "parallel": parallel,
-                "timeout": timeout,
-                "retries": retries
-            }
-        )
-    except Exception:
-        pass  # Don't fail command if history fails
+    # Add to history (written in the background)
+    record_history(
+        command="exec-all",
+        args=[command],
+        hosts=host_aliases,
+        success=(failed_count == 0),
+        metadata={
+            "total": len(results),
+            "succeeded": success_count,
+            "failed": failed_count,
+            "parallel": parallel,
+            "timeout": timeout,
+            "retries": retries
+        }
+    )
     
     if failed_count > 0 and not continue_on_error:
         raise typer.Exit(code=1)
@@ -365,7 +1047,16 @@ def exec_multi(
     plain: bool = typer.Option(False, "--plain", help="Plain output without formatting"),
     compact: bool = typer.Option(False, "--compact", help="Compact output format"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output for scripting"),
-    show_output: bool = typer.Option(False, "--show-output", help="Show detailed command output")
+    show_output: bool = typer.Option(False, "--show-output", help="Show detailed command output"),
+    no_output: bool = typer.Option(False, "--no-output", help="Only collect exit codes; skip downloading command output"),
+    max_output_bytes: int = typer.Option(
+        MAX_OUTPUT_BYTES, "--max-output-bytes", min=0,
+        help="Keep only the last N bytes of each host's output and errors (default 1 MiB; 0 keeps everything)"
+    ),
+    crypto_parallel: bool = typer.Option(
+        False, "--crypto-parallel",
+        help="Spread large runs over one process per CPU so SSH encryption uses every core (paramiko, even if asyncssh is installed)"
+    )
 ):
     """
     Execute a command on specific servers (comma-separated list).
@@ -375,7 +1066,8 @@ def exec_multi(
         remotex exec-multi "db01,db02" "pg_isready" --parallel 2
         remotex exec-multi "web01,db01" "uptime" --dry-run
     """
-    host_list = [h.strip() for h in hosts.split(',')]
+    # Order-preserving dedupe so "web01,web01" does not run twice
+    host_list = list(dict.fromkeys(h.strip() for h in hosts.split(',') if h.strip()))
     
     # Dry-run mode
     if dry_run:
@@ -413,187 +1105,82 @@ def exec_multi(
         ))
         console.print()
     
-    results = []
-    
-    # Skip progress bars for machine-readable formats
+    # Skip progress bars for machine-readable formats; JSON and CSV are
+    # written host by host while the rest are still running
+    report = None
     if json_output or csv_output or quiet:
-        with ThreadPoolExecutor(max_workers=parallel) as executor:
-            future_to_host = {
-                executor.submit(execute_on_host, host, command, timeout, retries): host 
-                for host in host_list
-            }
-            
-            for future in as_completed(future_to_host):
-                host = future_to_host[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    results.append({
-                        'host': host,
-                        'success': False,
-                        'output': '',
-                        'error': str(e),
-                        'exit_code': -1
-                    })
+        report = _open_report(json_output, csv_output, {"command": command, "hosts": host_list})
+        bulk = _execute_without_progress(
+            host_list, command, parallel, timeout, retries, no_output,
+            on_result=report.write if report else None, max_output=max_output_bytes or None,
+            crypto_parallel=crypto_parallel, on_flush=report.flush if report else None, quiet=True
+        )
     else:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task(f"[cyan]Executing on {len(host_list)} servers...", total=len(host_list))
-            
-            with ThreadPoolExecutor(max_workers=parallel) as executor:
-                future_to_host = {
-                    executor.submit(execute_on_host, host, command, timeout, retries): host 
-                    for host in host_list
-                }
-                
-                for future in as_completed(future_to_host):
-                    host = future_to_host[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        progress.update(task, advance=1)
-                    except Exception as e:
-                        results.append({
-                            'host': host,
-                            'success': False,
-                            'output': '',
-                            'error': str(e),
-                            'exit_code': -1
-                        })
-                        progress.update(task, advance=1)
-    
-    success_count = sum(1 for r in results if r['success'])
-    failed_count = len(results) - success_count
-    
-    # JSON output mode (pure, no decorations)
-    if json_output:
-        import json
-        output_data = {
-            "command": command,
-            "hosts": host_list,
-            "total": len(results),
-            "succeeded": success_count,
-            "failed": failed_count,
-            "results": [
-                {
-                    "host": r['host'],
-                    "success": r['success'],
-                    "exit_code": r['exit_code'],
-                    "output": r['output'],
-                    "error": r['error']
-                }
-                for r in results
-            ]
-        }
-        print(json.dumps(output_data, indent=2))
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
-    
-    # CSV output mode
-    if csv_output:
-        import csv
-        import sys
-        writer = csv.writer(sys.stdout)
-        writer.writerow(["Host", "Success", "ExitCode", "Output", "Error"])
-        for r in results:
-            writer.writerow([r['host'], r['success'], r['exit_code'], r['output'].replace('\n', ' '), r['error'].replace('\n', ' ')])
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
-    
-    # Quiet mode
-    if quiet:
-        for r in results:
-            status = "✓" if r['success'] else "✗"
-            output = r['output'].strip() or r['error'].strip()
-            print(f"{r['host']}: {status} [{r['exit_code']}] {output}")
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
+        bulk = _execute_with_progress(
+            host_list, command, parallel, timeout, retries, no_output, max_output=max_output_bytes or None,
+            crypto_parallel=crypto_parallel
+        )
     
-    # Plain mode
-    if plain:
-        print(f"\nExecuting on {len(host_list)} servers...\n")
-        for r in results:
-            status = "SUCCESS" if r['success'] else "FAILED"
-            print(f"{r['host']}: {status} (exit code: {r['exit_code']})")
-            if show_output and r['output']:
-                print(r['output'])
-            if r['error']:
-                print(f"Error: {r['error']}")
-            print()
-        print(f"Summary: {success_count}/{len(results)} successful")
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
+    results, success_count, failed_count = bulk
+    _warn_truncated(results, max_output_bytes)
     
-    # Compact mode
-    if compact:
-        for r in results:
-            status = "✓" if r['success'] else "✗"
-            output_preview = (r['output'] or r['error']).replace('\n', ' ')[:100]
-            console.print(f"{status} [cyan]{r['host']}[/cyan] [{r['exit_code']}]: {output_preview}")
-        console.print(f"\n{success_count}/{len(results)} successful")
+    # Lightweight formats print and exit; the formatted view follows otherwise
+    if _handle_output_format(
+        bulk, report,
+        json_output, csv_output, quiet, plain, compact, show_output,
+        heading=f"Executing on {len(host_list)} servers..."
+    ):
         if failed_count > 0:
             raise typer.Exit(code=1)
         return
     
     console.print()
     
-    # Show detailed output if requested
+    # Show detailed output if requested (rendered in a single pass)
     if show_output:
+        panels = []
         for result in results:
             border_style = "green" if result['success'] else "red"
             title = f"{'✓' if result['success'] else '✗'} {result['host']}"
-        
-        content = ""
-        if result['output']:
-            content += result['output'].rstrip()
-        if result['error']:
-            if content:
-                content += "\n\n[red bold]Errors:[/red bold]\n"
-            content += f"[red]{result['error'].rstrip()}[/red]"
-        
-        if not content:
-            content = "[dim]No output[/dim]"
-        
-        console.print(Panel(
-            content,
-            title=title,
-            border_style=border_style,
-            box=box.ROUNDED
-        ))
+            
+            content = ""
+            if result['output']:
+                content += result['output'].rstrip()
+            if result['error']:
+                if content:
+                    content += "\n\n[red bold]Errors:[/red bold]\n"
+                content += f"[red]{result['error'].rstrip()}[/red]"
+            
+            if not content:
+                content = "[dim]No output[/dim]"
+            
+            panels.append(Panel(
+                content,
+                title=title,
+                border_style=border_style,
+                box=box.ROUNDED
+            ))
+        console.print(Group(*panels))
     
-    success_count = sum(1 for r in results if r['success'])
     console.print(f"\n[bold]Summary:[/bold] {success_count}/{len(results)} successful")
     
-    # Add to history
-    try:
-        add_to_history(
-            command="exec-multi",
-            args=[command],
-            hosts=host_list,
-            success=(success_count == len(results)),
-            metadata={
-                "hosts_list": hosts,
-                "total": len(results),
-                "succeeded": success_count,
-                "failed": len(results) - success_count,
-                "parallel": parallel,
-                "timeout": timeout
-            }
-        )
-    except Exception:
-        pass  # Don't fail command if history fails
+    # Add to history (written in the background)
+    record_history(
+        command="exec-multi",
+        args=[command],
+        hosts=host_list,
+        success=(failed_count == 0),
+        metadata={
+            "hosts_list": hosts,
+            "total": len(results),
+            "succeeded": success_count,
+            "failed": failed_count,
+            "parallel": parallel,
+            "timeout": timeout
+        }
+    )
     
-    if success_count < len(results):
+    if failed_count > 0:
         raise typer.Exit(code=1)
 
 
@@ -609,7 +1196,16 @@ def exec_group(
     plain: bool = typer.Option(False, "--plain", help="Plain output without formatting"),
     compact: bool = typer.Option(False, "--compact", help="Compact output format"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output for scripting"),
-    show_output: bool = typer.Option(False, "--show-output", help="Show detailed command output")
+    show_output: bool = typer.Option(False, "--show-output", help="Show detailed command output"),
+    no_output: bool = typer.Option(False, "--no-output", help="Only collect exit codes; skip downloading command output"),
+    max_output_bytes: int = typer.Option(
+        MAX_OUTPUT_BYTES, "--max-output-bytes", min=0,
+        help="Keep only the last N bytes of each host's output and errors (default 1 MiB; 0 keeps everything)"
+    ),
+    crypto_parallel: bool = typer.Option(
+        False, "--crypto-parallel",
+        help="Spread large runs over one process per CPU so SSH encryption uses every core (paramiko, even if asyncssh is installed)"
+    )
 ):
     """
     Execute a command on all servers in a group.
@@ -621,7 +1217,7 @@ def exec_group(
     """
     from remotex import config
     
-    servers = config.get_group_servers(group_name)
+    servers = list(dict.fromkeys(config.get_group_servers(group_name)))
     
     if not servers:
         console.print(f"[red]✗[/red] Group '[cyan]{group_name}[/cyan]' not found or empty")
@@ -667,177 +1263,62 @@ def exec_group(
         ))
         console.print()
     
-    results = []
-    
-    # Skip progress bars for machine-readable formats
+    # Skip progress bars for machine-readable formats; JSON and CSV are
+    # written host by host while the rest are still running
+    report = None
+    summary = None
     if json_output or csv_output or quiet:
-        with ThreadPoolExecutor(max_workers=parallel) as executor:
-            future_to_host = {
-                executor.submit(execute_on_host, host, command, timeout, retries): host 
-                for host in servers
-            }
-            
-            for future in as_completed(future_to_host):
-                host = future_to_host[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    results.append({
-                        'host': host,
-                        'success': False,
-                        'output': '',
-                        'error': str(e),
-                        'exit_code': -1
-                    })
+        report = _open_report(json_output, csv_output, {"command": command, "group": group_name})
+        bulk = _execute_without_progress(
+            servers, command, parallel, timeout, retries, no_output,
+            on_result=report.write if report else None, max_output=max_output_bytes or None,
+            crypto_parallel=crypto_parallel, on_flush=report.flush if report else None, quiet=True
+        )
     else:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task(f"[cyan]Executing on {len(servers)} servers...", total=len(servers))
-            
-            with ThreadPoolExecutor(max_workers=parallel) as executor:
-                future_to_host = {
-                    executor.submit(execute_on_host, host, command, timeout, retries): host 
-                    for host in servers
-                }
-                
-                for future in as_completed(future_to_host):
-                    host = future_to_host[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        progress.update(task, advance=1)
-                    except Exception as e:
-                        results.append({
-                            'host': host,
-                            'success': False,
-                            'output': '',
-                            'error': str(e),
-                            'exit_code': -1
-                        })
-                        progress.update(task, advance=1)
-    
-    # Display results
-    success_count = sum(1 for r in results if r['success'])
-    failed_count = len(results) - success_count
-    
-    # JSON output mode (pure, no decorations)
-    if json_output:
-        import json
-        output_data = {
-            "command": command,
-            "group": group_name,
-            "total": len(results),
-            "succeeded": success_count,
-            "failed": failed_count,
-            "results": [
-                {
-                    "host": r['host'],
-                    "success": r['success'],
-                    "exit_code": r['exit_code'],
-                    "output": r['output'],
-                    "error": r['error']
-                }
-                for r in results
-            ]
-        }
-        print(json.dumps(output_data, indent=2))
-        
-        # Audit log
-        from remotex.audit import log_command_execution
-        log_command_execution(
-            command_type="exec-group",
-            hosts=servers,
-            command=command,
-            results={r['host']: r for r in results},
-            metadata={"group": group_name, "parallel": parallel, "timeout": timeout, "retries": retries}
+        # The summary table is filled in host order while the run progresses
+        summary = None if (plain or compact or len(servers) > SUMMARY_TABLE_MAX_HOSTS) else _summary_table()
+        bulk = _execute_with_progress(
+            servers, command, parallel, timeout, retries, no_output, max_output=max_output_bytes or None,
+            crypto_parallel=crypto_parallel, on_result=partial(_add_summary_row, summary) if summary is not None else None
         )
-        
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
     
-    # CSV output mode
-    if csv_output:
-        import csv
-        import sys
-        writer = csv.writer(sys.stdout)
-        writer.writerow(["Host", "Success", "ExitCode", "Output", "Error"])
-        for r in results:
-            writer.writerow([r['host'], r['success'], r['exit_code'], r['output'].replace('\n', ' '), r['error'].replace('\n', ' ')])
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
-    
-    # Quiet mode
-    if quiet:
-        for r in results:
-            status = "✓" if r['success'] else "✗"
-            output = r['output'].strip() or r['error'].strip()
-            print(f"{r['host']}: {status} [{r['exit_code']}] {output}")
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
+    results, success_count, failed_count = bulk
+    _warn_truncated(results, max_output_bytes)
     
-    # Plain mode
-    if plain:
-        print(f"\nExecuting on {len(servers)} servers in group '{group_name}'...\n")
-        for r in results:
-            status = "SUCCESS" if r['success'] else "FAILED"
-            print(f"{r['host']}: {status} (exit code: {r['exit_code']})")
-            if show_output and r['output']:
-                print(r['output'])
-            if r['error']:
-                print(f"Error: {r['error']}")
-            print()
-        print(f"Summary: {success_count}/{len(results)} successful")
-        if failed_count > 0:
-            raise typer.Exit(code=1)
-        return
-    
-    # Compact mode
-    if compact:
-        for r in results:
-            status = "✓" if r['success'] else "✗"
-            output_preview = (r['output'] or r['error']).replace('\n', ' ')[:100]
-            console.print(f"{status} [cyan]{r['host']}[/cyan] [{r['exit_code']}]: {output_preview}")
-        console.print(f"\n{success_count}/{len(results)} successful")
+    # Lightweight formats print and exit; the formatted view follows otherwise
+    if _handle_output_format(
+        bulk, report,
+        json_output, csv_output, quiet, plain, compact, show_output,
+        heading=f"Executing on {len(servers)} servers in group '{group_name}'..."
+    ):
+        if json_output:
+            # Audit log
+            from remotex.audit import log_bulk_execution
+            log_bulk_execution(
+                "exec-group",
+                command,
+                results,
+                hosts=servers,
+                metadata={"group": group_name, "parallel": parallel, "timeout": timeout, "retries": retries},
+                results_can_mutate=True  # output was printed above
+            )
         if failed_count > 0:
             raise typer.Exit(code=1)
         return
     
     console.print()
-    failed_count = len(results) - success_count
     
-    # Summary table
-    table = Table(title="Execution Summary", box=box.ROUNDED)
-    table.add_column("Server", style="cyan")
-    table.add_column("Status", style="bold")
-    table.add_column("Exit Code", justify="center")
-    table.add_column("Output Preview", style="dim")
-    
-    for result in results:
-        status = "[green]✓ Success[/green]" if result['success'] else "[red]✗ Failed[/red]"
-        preview = result['output'][:150].replace('\n', ' ') if result['output'] else result['error'][:150].replace('\n', ' ')
-        table.add_row(
-            result['host'],
-            status,
-            str(result['exit_code']),
-            preview + "..." if len(preview) == 150 else preview
-        )
-    
-    console.print(table)
+    if summary is not None:
+        console.print(summary)
+    else:
+        console.print(_compact_lines(results), highlight=False, end="")
     console.print()
     console.print(f"[bold]Results:[/bold] [green]{success_count} successful[/green], [red]{failed_count} failed[/red]")
     
-    # Show detailed output if requested
+    # Show detailed output if requested (rendered in a single pass)
     if show_output:
         console.print("\n[bold cyan]Detailed Output:[/bold cyan]")
+        panels = []
         for result in results:
             title = f"{result['host']}"
             border_style = "green" if result['success'] else "red"
@@ -853,45 +1334,43 @@ def exec_group(
             if not content:
                 content = "[dim]No output[/dim]"
             
-            console.print(Panel(
+            panels.append(Panel(
                 content,
                 title=title,
                 border_style=border_style,
                 box=box.ROUNDED
             ))
+        console.print(Group(*panels))
     
     # Audit log
-    from remotex.audit import log_command_execution
-    log_command_execution(
-        command_type="exec-group",
+    from remotex.audit import log_bulk_execution
+    log_bulk_execution(
+        "exec-group",
+        command,
+        results,
         hosts=servers,
-        command=command,
-        results={r['host']: r for r in results},
-        metadata={"group": group_name, "parallel": parallel, "timeout": timeout}
+        metadata={"group": group_name, "parallel": parallel, "timeout": timeout},
+        results_can_mutate=True  # results are not read below
     )
     
-    success_count = sum(1 for r in results if r['success'])
     console.print(f"\n[bold]Summary:[/bold] {success_count}/{len(results)} successful")
     
-    # Add to history
-    try:
-        add_to_history(
-            command="exec-group",
-            args=[command],
-            hosts=servers,
-            success=(success_count == len(results)),
-            metadata={
-                "group_name": group_name,
-                "total": len(results),
-                "succeeded": success_count,
-                "failed": len(results) - success_count,
-                "parallel": parallel,
-                "timeout": timeout
-            }
-        )
-    except Exception:
-        pass  # Don't fail command if history fails
+    # Add to history (written in the background)
+    record_history(
+        command="exec-group",
+        args=[command],
+        hosts=servers,
+        success=(failed_count == 0),
+        metadata={
+            "group_name": group_name,
+            "total": len(results),
+            "succeeded": success_count,
+            "failed": failed_count,
+            "parallel": parallel,
+            "timeout": timeout
+        }
+    )
     
-    if success_count < len(results):
+    if failed_count > 0:
         raise typer.Exit(code=1)
 
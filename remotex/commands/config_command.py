@@ -10,9 +10,7 @@ from rich.panel import Panel
 from rich import box
 
 from remotex.config import (
-    get_default_server, set_default_server,
-    get_server_alias, set_server_alias,
-    load_config, save_config,
+    set_default_server, set_server_alias, load_config,
     validate_config, export_config, import_config
 )
 from remotex.exit_codes import ExitCode
@@ -51,6 +49,7 @@ def show_config():
     table.add_row("Output Mode", config.get("output_mode", "normal"))
     table.add_row("Parallel Connections", str(config.get("parallel_connections", 5)))
     table.add_row("Timeout (seconds)", str(config.get("timeout", 30)))
+    table.add_row("Backend", config.get("backend", "auto"))
     
     # Show aliases
     aliases = config.get("aliases", {})
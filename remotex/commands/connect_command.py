@@ -3,6 +3,7 @@ Interactive Shell Connection Module
 Handles interactive SSH shell sessions with PTY support.
 """
 
+import os
 import sys
 import platform
 
@@ -16,21 +17,143 @@ from remotex.ssh_client import create_ssh_client
 
 console = Console()
 
-# Platform-specific imports
-if platform.system() == 'Windows':
-    import msvcrt
-    import threading
-else:
-    import select
-    import termios
-    import tty
-
 
 def register_connect_command(app: typer.Typer):
     """Register the connect command to the app."""
     app.command()(connect)
 
 
+# Channel reads match paramiko's max packet size; stdin reads cover a paste burst
+CHANNEL_READ_SIZE = 65536
+STDIN_READ_SIZE = 4096
+
+
+def _write_stdout(data: bytes):
+    """Write bytes straight to the stdout fd, bypassing Python's buffering."""
+    view = memoryview(data)
+    while view:
+        written = os.write(sys.stdout.fileno(), view)
+        view = view[written:]
+
+
+def _handle_channel_input(channel) -> bool:
+    """
+    Copy pending channel output to the terminal.
+    
+    Returns:
+        False once the remote side has closed the channel
+    """
+    import socket
+    
+    try:
+        data = channel.recv(CHANNEL_READ_SIZE)
+    except socket.timeout:
+        # Woken for stderr or a window adjust with no stdout to read
+        return True
+    if len(data) == 0:
+        return False
+    _write_stdout(data)
+    return True
+
+
+def _handle_stdin_input(channel, stdin_fd: int) -> bool:
+    """
+    Forward everything currently typed (or pasted) to the channel.
+    
+    Returns:
+        False once stdin reaches EOF
+    """
+    # The selector reported stdin readable, so a single read cannot block
+    data = os.read(stdin_fd, STDIN_READ_SIZE)
+    if len(data) == 0:
+        return False
+    channel.sendall(data)
+    return True
+
+
+def _handle_unix_shell(channel):
+    """Relay a PTY session between the local terminal and the channel."""
+    import selectors
+    import termios
+    import tty
+    
+    # Non-blocking: the selector says when to read, and a wakeup with no
+    # stdout data raises socket.timeout instead of stalling
+    channel.settimeout(0.0)
+    stdin_fd = sys.stdin.fileno()
+    oldtty = termios.tcgetattr(stdin_fd)
+    try:
+        tty.setraw(stdin_fd)
+        tty.setcbreak(stdin_fd)
+        
+        # No timeout: channel close and exit both wake the selector via EOF
+        with selectors.DefaultSelector() as selector:
+            selector.register(channel, selectors.EVENT_READ)
+            selector.register(stdin_fd, selectors.EVENT_READ)
+            while True:
+                for key, _ in selector.select():
+                    if key.fileobj is channel:
+                        keep_going = _handle_channel_input(channel)
+                    else:
+                        keep_going = _handle_stdin_input(channel, stdin_fd)
+                    if not keep_going:
+                        return
+    finally:
+        termios.tcsetattr(stdin_fd, termios.TCSADRAIN, oldtty)
+
+
+def _read_stdin_windows(channel):
+    """Forward console keystrokes to the channel until Ctrl+C."""
+    import msvcrt
+    
+    try:
+        while True:
+            # getch() blocks until a key arrives; anything typed or pasted
+            # behind it goes out in the same send
+            pending = bytearray(msvcrt.getch())
+            while msvcrt.kbhit():
+                pending += msvcrt.getch()
+            interrupt = pending.find(b'\x03')  # Ctrl+C
+            if interrupt >= 0:
+                if interrupt:
+                    channel.sendall(bytes(pending[:interrupt]))
+                # Closing the channel also ends the output thread's recv()
+                channel.close()
+                return
+            channel.sendall(bytes(pending))
+    except Exception:
+        pass  # Channel closed by the remote side
+
+
+def _read_channel_windows(channel):
+    """Copy channel output to the console until the session ends."""
+    while True:
+        try:
+            # Blocks until output arrives; returns nothing once the channel closes
+            data = channel.recv(CHANNEL_READ_SIZE)
+        except Exception:
+            break
+        if len(data) == 0:
+            break
+        _write_stdout(data)
+
+
+def _handle_windows_shell(channel):
+    """Relay a session on Windows, where select() does not work on the console."""
+    import threading
+    
+    channel.settimeout(None)
+    stdin_thread = threading.Thread(target=_read_stdin_windows, args=(channel,), daemon=True)
+    channel_thread = threading.Thread(target=_read_channel_windows, args=(channel,), daemon=True)
+    
+    stdin_thread.start()
+    channel_thread.start()
+    
+    # Wait for channel to close; the stdin thread may still be blocked in
+    # getch() and, being a daemon, does not hold up the exit
+    channel_thread.join()
+
+
 def connect(
     host: str = typer.Argument(..., help="SSH host alias from ~/.ssh/config")
 ):
@@ -65,76 +188,11 @@ def connect(
     try:
         # Open interactive shell with PTY
         channel = client.invoke_shell()
-        channel.settimeout(0.0)
         
         if platform.system() == 'Windows':
-            # Windows implementation
-            def read_stdin():
-                while True:
-                    if msvcrt.kbhit():
-                        char = msvcrt.getch()
-                        if char == b'\x03':  # Ctrl+C
-                            break
-                        channel.send(char)
-            
-            def read_channel():
-                while True:
-                    try:
-                        if channel.recv_ready():
-                            data = channel.recv(1024)
-                            if len(data) == 0:
-                                break
-                            sys.stdout.buffer.write(data)
-                            sys.stdout.flush()
-                        if channel.exit_status_ready():
-                            break
-                    except Exception:
-                        break
-            
-            # Start threads for reading
-            stdin_thread = threading.Thread(target=read_stdin, daemon=True)
-            channel_thread = threading.Thread(target=read_channel, daemon=True)
-            
-            stdin_thread.start()
-            channel_thread.start()
-            
-            # Wait for channel to close
-            channel_thread.join()
-            stdin_thread.join()
+            _handle_windows_shell(channel)
         else:
-            # Unix/Linux implementation
-            oldtty = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setraw(sys.stdin.fileno())
-                tty.setcbreak(sys.stdin.fileno())
-                channel.settimeout(0.0)
-                
-                while True:
-                    # Check if channel is still open
-                    if channel.exit_status_ready():
-                        break
-                    
-                    # Use select to handle I/O
-                    r, w, e = select.select([channel, sys.stdin], [], [], 0.1)
-                    
-                    if channel in r:
-                        try:
-                            data = channel.recv(1024)
-                            if len(data) == 0:
-                                break
-                            sys.stdout.buffer.write(data)
-                            sys.stdout.flush()
-                        except Exception:
-                            break
-                    
-                    if sys.stdin in r:
-                        input_data = sys.stdin.read(1)
-                        if len(input_data) == 0:
-                            break
-                        channel.send(input_data.encode() if isinstance(input_data, str) else input_data)
-                        
-            finally:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, oldtty)
+            _handle_unix_shell(channel)
         
         console.print()
         console.print(Panel(
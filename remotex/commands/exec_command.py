@@ -3,14 +3,18 @@ Execute Command Module
 Handles remote command execution on SSH servers.
 """
 
+import sys
+
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich import box
 
+from remotex.config import get_ssh_backend, get_timeout
 from remotex.ssh_config import parse_ssh_config
-from remotex.ssh_client import create_ssh_client
-from remotex.history import add_to_history
+from remotex.ssh_client import create_ssh_client, run_command
+from remotex.ssh_backend import BACKEND_CONTROLMASTER, run_via_controlmaster
+from remotex.history import record_history
 
 console = Console()
 
@@ -54,39 +58,47 @@ def exec_command(
     elif plain and not compact and not silent:
         console.print(f"Connecting to {host}...")
     
-    # Create SSH client
-    client = create_ssh_client(host_config)
-    if not client:
-        raise typer.Exit(code=1)
+    # Create SSH client (the controlmaster backend runs through OpenSSH instead)
+    client = None
+    if get_ssh_backend() != BACKEND_CONTROLMASTER:
+        client = create_ssh_client(host_config)
+        if not client:
+            raise typer.Exit(code=1)
     
     try:
         if not plain and not compact and not silent:
             console.print()
         
-        # Execute command
-        stdin, stdout, stderr = client.exec_command(command)
-        
-        # Read output
-        output = stdout.read().decode('utf-8')
-        error = stderr.read().decode('utf-8')
-        exit_status = stdout.channel.recv_exit_status()
+        if client is None:
+            result = run_via_controlmaster(host, command, timeout=get_timeout())
+            output = result['output']
+            error = result['error']
+            exit_status = result['exit_code']
+        else:
+            # Execute command, reading stdout and stderr as they arrive. No
+            # time limit here: exec has no --timeout flag, and long commands
+            # (upgrades, builds) must be able to run to completion
+            stdout, stderr, exit_status = run_command(client, command, timeout=None)
+            output = stdout.decode('utf-8', errors='ignore')
+            error = stderr.decode('utf-8', errors='ignore')
         
         # Display output based on mode
         if silent:
             # Silent mode - no output, just exit code
             pass
         elif compact:
-            # Compact mode - minimal output
+            # Compact mode - minimal output, written as-is so remote text is
+            # never parsed as markup or wrapped to the terminal width
             if output:
-                console.print(output.strip())
+                print(output.strip())
             if error:
-                console.print(f"[red]{error.strip()}[/red]")
+                console.print(error.strip(), style="red", markup=False, highlight=False)
         elif plain:
             # Plain mode - just print output
             if output:
-                console.print(output, end='')
+                sys.stdout.write(output)
             if error:
-                console.print(error, end='', style="red")
+                console.print(error, end='', style="red", markup=False, highlight=False)
         else:
             # Formatted mode with panels
             if output or error:
@@ -123,28 +135,34 @@ def exec_command(
                     box=box.ROUNDED
                 ))
         
-        # Add to history
-        try:
-            add_to_history(
-                command="exec",
-                args=[command],
-                hosts=[host],
-                success=(exit_status == 0),
-                metadata={"exit_code": exit_status, "plain": plain, "compact": compact}
-            )
-        except Exception:
-            pass  # Don't fail command if history fails
+        # Add to history (written in the background)
+        record_history(
+            command="exec",
+            args=[command],
+            hosts=[host],
+            success=(exit_status == 0),
+            metadata={"exit_code": exit_status, "plain": plain, "compact": compact}
+        )
         
         # Exit with command's exit status
         if exit_status != 0:
             raise typer.Exit(code=exit_status)
             
+    except typer.Exit:
+        # The command's own exit status, raised above; not an execution error
+        raise
     except Exception as e:
-        console.print(Panel(
-            f"[red]Error executing command[/red]\n\n{str(e)}",
-            title="❌ Execution Error",
-            border_style="red"
-        ))
+        if silent:
+            pass
+        elif plain or compact:
+            console.print(f"Error executing command: {e}", style="red", markup=False, highlight=False)
+        else:
+            console.print(Panel(
+                f"[red]Error executing command[/red]\n\n{e}",
+                title="❌ Execution Error",
+                border_style="red"
+            ))
         raise typer.Exit(code=1)
     finally:
-        client.close()
+        if client:
+            client.close()
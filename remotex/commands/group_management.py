@@ -6,7 +6,6 @@ Manage server groups for bulk operations
 import typer
 from rich.console import Console
 from rich.table import Table
-from typing import List
 
 from remotex import config
 from remotex.ssh_config import get_all_hosts
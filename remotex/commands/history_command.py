@@ -3,10 +3,8 @@ Command History Management
 """
 
 import typer
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.text import Text
 from datetime import datetime
 
 from remotex.history import (
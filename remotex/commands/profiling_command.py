@@ -3,8 +3,6 @@ Performance Profiling Commands
 """
 
 import typer
-from pathlib import Path
-from rich.console import Console
 from rich.table import Table
 
 from remotex.profiling import PROFILE_DIR, analyze_profile, get_profile_summary
@@ -5,8 +5,6 @@ Common DevOps shortcuts and frequently used commands.
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich import box
 
 from typing import Optional
 
@@ -7,7 +7,6 @@ import subprocess
 import json
 from typing import Optional, Dict
 from rich.table import Table
-from rich.panel import Panel
 
 from remotex.config import CONFIG_DIR
 from remotex.utils import console
@@ -4,11 +4,18 @@ Handles user preferences like default server, output mode, etc.
 Supports environment variables for configuration.
 """
 
+import copy
 import json
 import os
+import tempfile
 from pathlib import Path
 from typing import Optional, Dict, Tuple, List
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 CONFIG_DIR = Path.home() / ".remotex"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
@@ -16,15 +23,54 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 ENV_PREFIX = "REMOTEX_"
 
 
+def _loads(data: bytes) -> Dict:
+    """Parse config JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(config: Dict) -> bytes:
+    """Serialize config as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
+
 def ensure_config_dir():
     """Ensure config directory exists."""
     if not CONFIG_DIR.exists():
         CONFIG_DIR.mkdir(mode=0o755, parents=True)
 
 
-def load_config() -> Dict:
-    """Load configuration from file and environment variables."""
-    ensure_config_dir()
+# Transport tuning applied to paramiko connections (overridable under "ssh")
+DEFAULT_SSH_TUNING: Dict = {
+    "window_size": 134217728,  # 128 MiB channel window
+    "nodelay": True,  # disable Nagle's algorithm on the socket
+    "keepalive": 30,  # seconds between keepalives, 0 disables
+    "compress": False,  # zlib compression; helps large outputs over slow links
+    "connect_timeout": 10  # seconds to wait for the TCP connect and SSH banner
+}
+
+
+# Parsed config.json, reused while the file's path, mtime and size are unchanged
+_config_cache: Optional[Dict] = None
+_config_cache_key: Optional[Tuple] = None
+
+
+def _load_config_file() -> Dict:
+    """Read config.json merged with defaults, cached until the file changes."""
+    global _config_cache, _config_cache_key
+    
+    try:
+        stat = CONFIG_FILE.stat()
+        file_version: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_version = None
+    
+    cache_key = (str(CONFIG_FILE), file_version)
+    if _config_cache is not None and cache_key == _config_cache_key:
+        return _config_cache
     
     # Default configuration
     default_config: Dict = {
@@ -35,23 +81,36 @@ def load_config() -> Dict:
         "groups": {},  # group_name: [server1, server2, ...]
         "server_tags": {},  # server_name: [tag1, tag2, ...]
         "command_aliases": {},  # alias_name: command_string
-        "audit_enabled": True
+        "audit_enabled": True,
+        "audit_max_size": 104857600,  # bytes before audit.log is rotated, 0 disables
+        "backend": "auto",  # auto (asyncssh for bulk when installed), paramiko, controlmaster, asyncssh
+        "ssh": dict(DEFAULT_SSH_TUNING)
     }
     
     # Load from file
-    if CONFIG_FILE.exists():
+    if file_version is not None:
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                # Merge with defaults
-                for key, value in default_config.items():
-                    if key not in config:
-                        config[key] = value
+            config = _loads(CONFIG_FILE.read_bytes())
+            # Merge with defaults
+            for key, value in default_config.items():
+                if key not in config:
+                    config[key] = value
         except Exception:
             config = default_config.copy()
     else:
         config = default_config.copy()
     
+    _config_cache, _config_cache_key = config, cache_key
+    return config
+
+
+def load_config() -> Dict:
+    """Load configuration from file and environment variables."""
+    ensure_config_dir()
+    
+    # Callers may mutate the result before save_config(), so never hand out the cache
+    config = copy.deepcopy(_load_config_file())
+    
     # Override with environment variables (env vars take precedence)
     env_default_server = os.getenv(f"{ENV_PREFIX}DEFAULT_SERVER")
     if env_default_server:
@@ -75,6 +134,10 @@ def load_config() -> Dict:
         except ValueError:
             pass
     
+    env_backend = os.getenv(f"{ENV_PREFIX}BACKEND")
+    if env_backend:
+        config["backend"] = env_backend
+    
     env_audit = os.getenv(f"{ENV_PREFIX}AUDIT_ENABLED")
     if env_audit:
         config["audit_enabled"] = env_audit.lower() in ("true", "1", "yes", "on")
@@ -84,10 +147,30 @@ def load_config() -> Dict:
 
 def save_config(config: Dict):
     """Save configuration to file."""
+    global _config_cache
     ensure_config_dir()
     
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    # Write a sibling temp file and rename it over the config, so a crash or a
+    # concurrent invocation never leaves a half-written config.json behind
+    fd, tmp_path = tempfile.mkstemp(dir=CONFIG_FILE.parent, prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_dumps(config))
+        # mkstemp creates 0600; keep the permissions the config already had
+        try:
+            mode = CONFIG_FILE.stat().st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, CONFIG_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    _config_cache = None
 
 
 def get_default_server() -> Optional[str]:
@@ -116,6 +199,27 @@ def set_output_mode(mode: str):
     save_config(config)
 
 
+def get_timeout() -> int:
+    """Get the default command timeout in seconds."""
+    config = load_config()
+    return config.get("timeout", 30)
+
+
+def get_ssh_backend() -> str:
+    """Get the command execution backend (auto, paramiko, controlmaster or asyncssh)."""
+    config = load_config()
+    return config.get("backend", "auto")
+
+
+def get_ssh_tuning() -> Dict:
+    """Get paramiko transport tuning, with missing keys filled from defaults."""
+    config = load_config()
+    tuning = dict(DEFAULT_SSH_TUNING)
+    if isinstance(config.get("ssh"), dict):
+        tuning.update(config["ssh"])
+    return tuning
+
+
 def get_server_alias(alias: str) -> Optional[str]:
     """Get actual server name from alias."""
     config = load_config()
@@ -287,6 +391,11 @@ def validate_config() -> Tuple[bool, List[str]]:
         if config.get("output_mode") not in valid_modes:
             errors.append(f"Invalid output_mode: {config.get('output_mode')}. Must be one of {valid_modes}")
         
+        # Validate backend
+        valid_backends = ["auto", "paramiko", "controlmaster", "asyncssh"]
+        if config.get("backend", "auto") not in valid_backends:
+            errors.append(f"Invalid backend: {config.get('backend')}. Must be one of {valid_backends}")
+        
         # Validate parallel_connections
         parallel = config.get("parallel_connections", 5)
         if not isinstance(parallel, int) or parallel < 1 or parallel > 50:
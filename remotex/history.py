@@ -3,16 +3,28 @@ RemoteX Command History
 Track and replay command history
 """
 
+import atexit
 import json
+import queue
 import shlex
-from pathlib import Path
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 
 from remotex.config import CONFIG_DIR
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 HISTORY_FILE = CONFIG_DIR / "history.json"
 
+# Entries recorded by record_history(), written by a background thread
+_history_queue: queue.Queue = queue.Queue()
+_history_thread: Optional[threading.Thread] = None
+_history_lock = threading.Lock()
+
 
 def ensure_history_file():
     """Ensure history file exists."""
@@ -22,6 +34,22 @@ def ensure_history_file():
             json.dump({"commands": []}, f)
 
 
+def _load_history() -> Dict:
+    """Read the history file, using orjson when it is installed."""
+    with open(HISTORY_FILE, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Dict) -> bytes:
+    """Serialize history as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
 def add_to_history(
     command: str,
     args: List[str],
@@ -32,8 +60,7 @@ def add_to_history(
     """Add a command to history."""
     ensure_history_file()
     
-    with open(HISTORY_FILE, 'r') as f:
-        data = json.load(f)
+    data = _load_history()
     
     entry = {
         "id": len(data["commands"]) + 1,
@@ -54,12 +81,59 @@ def add_to_history(
     if len(data["commands"]) > 1000:
         data["commands"] = data["commands"][-1000:]
     
-    with open(HISTORY_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(HISTORY_FILE, 'wb') as f:
+        f.write(_dumps(data))
     
     return entry["id"]
 
 
+def _history_worker():
+    while True:
+        kwargs = _history_queue.get()
+        try:
+            add_to_history(**kwargs)
+        except Exception:
+            pass  # Don't fail command if history fails
+        finally:
+            _history_queue.task_done()
+
+
+def record_history(
+    command: str,
+    args: List[str],
+    hosts: List[str],
+    success: bool = True,
+    metadata: Optional[Dict] = None
+):
+    """
+    Queue a command for add_to_history() on a background thread.
+    
+    The history file is rewritten on every entry, so commands hand it off
+    instead of waiting on the write. Queued entries are written before the
+    process exits and before history is read back.
+    """
+    global _history_thread
+    with _history_lock:
+        if _history_thread is None:
+            _history_thread = threading.Thread(target=_history_worker, name="remotex-history", daemon=True)
+            _history_thread.start()
+    _history_queue.put({
+        "command": command,
+        "args": args,
+        "hosts": hosts,
+        "success": success,
+        "metadata": metadata,
+    })
+
+
+def flush_history():
+    """Block until every entry queued by record_history() has been written."""
+    _history_queue.join()
+
+
+atexit.register(flush_history)
+
+
 def get_history(
     limit: int = 50,
     host: Optional[str] = None,
@@ -67,11 +141,11 @@ def get_history(
     since: Optional[str] = None
 ) -> List[Dict]:
     """Get command history with optional filters."""
+    flush_history()
     if not HISTORY_FILE.exists():
         return []
     
-    with open(HISTORY_FILE, 'r') as f:
-        data = json.load(f)
+    data = _load_history()
     
     commands = data.get("commands", [])
     
@@ -92,11 +166,11 @@ def get_history(
 
 def get_history_entry(entry_id: int) -> Optional[Dict]:
     """Get a specific history entry by ID."""
+    flush_history()
     if not HISTORY_FILE.exists():
         return None
     
-    with open(HISTORY_FILE, 'r') as f:
-        data = json.load(f)
+    data = _load_history()
     
     for cmd in data.get("commands", []):
         if cmd.get("id") == entry_id:
@@ -107,6 +181,7 @@ def get_history_entry(entry_id: int) -> Optional[Dict]:
 
 def clear_history():
     """Clear all command history."""
+    flush_history()
     ensure_history_file()
     with open(HISTORY_FILE, 'w') as f:
         json.dump({"commands": []}, f)
@@ -114,12 +189,12 @@ def clear_history():
 
 def export_history(output_file: str):
     """Export history to a file."""
+    flush_history()
     if not HISTORY_FILE.exists():
         return
     
-    with open(HISTORY_FILE, 'r') as f:
-        data = json.load(f)
+    data = _load_history()
     
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(_dumps(data))
 
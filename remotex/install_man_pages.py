@@ -5,7 +5,6 @@ Usage: python -m remotex.install_man_pages
 """
 
 import os
-import sys
 import shutil
 from pathlib import Path
 
@@ -6,7 +6,7 @@ Caching and optimization utilities for faster operations.
 import json
 import time
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict
 from functools import wraps
 
 # Cache directory
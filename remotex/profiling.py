@@ -8,7 +8,7 @@ import pstats
 import io
 from functools import wraps
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable
 from contextlib import contextmanager
 
 from remotex.config import CONFIG_DIR
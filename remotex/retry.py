@@ -4,7 +4,7 @@ Implements retry mechanisms with exponential backoff for SSH operations
 """
 
 import time
-from typing import Callable, Dict, Any, Optional
+from typing import Any, Callable, Dict, Optional
 from rich.console import Console
 
 console = Console()
@@ -16,7 +16,8 @@ def retry_with_backoff(
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
     max_delay: float = 60.0,
-    verbose: bool = False
+    verbose: bool = False,
+    host: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Retry a function with exponential backoff.
@@ -28,6 +29,7 @@ def retry_with_backoff(
         backoff_factor: Multiplier for delay after each attempt
         max_delay: Maximum delay between retries
         verbose: Print retry attempts
+        host: Host alias recorded in results built here when func raises
         
     Returns:
         Result from successful execution or last failed attempt
@@ -65,6 +67,8 @@ def retry_with_backoff(
                 'exit_code': -1,
                 'output': ''
             }
+            if host is not None:
+                last_result['host'] = host
             
             if attempt < max_retries:
                 if verbose:
@@ -79,12 +83,16 @@ def retry_with_backoff(
     if verbose:
         console.print(f"[red]✗[/red] All {max_retries + 1} attempts failed")
     
-    return last_result or {
-        'success': False,
-        'error': 'All retry attempts failed',
-        'exit_code': -1,
-        'output': ''
-    }
+    if last_result is None:
+        last_result = {
+            'success': False,
+            'error': 'All retry attempts failed',
+            'exit_code': -1,
+            'output': ''
+        }
+        if host is not None:
+            last_result['host'] = host
+    return last_result
 
 
 def should_retry_error(error: str, exit_code: int) -> bool:
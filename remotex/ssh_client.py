@@ -4,29 +4,41 @@ Handles SSH client creation and connection management.
 """
 
 import os
-from typing import Optional
+import socket
+import time
+from typing import TYPE_CHECKING, Optional, Tuple
 
-import paramiko
 from rich.console import Console
 from rich.panel import Panel
 
+from remotex.config import get_ssh_tuning
+
+if TYPE_CHECKING:
+    import paramiko
+
 console = Console()
 
 
-def create_ssh_client(host_config: dict) -> Optional[paramiko.SSHClient]:
+def create_ssh_client(host_config: dict, quiet: bool = False) -> Optional["paramiko.SSHClient"]:
     """
     Create and connect SSH client using host configuration.
     
     Args:
         host_config: Dictionary with connection details
+        quiet: Suppress the connection error panel on failure
         
     Returns:
         Connected SSHClient or None on failure
     """
     if not host_config.get('hostname'):
-        console.print("[red]Error: Hostname not found in SSH config[/red]")
+        if not quiet:
+            console.print("[red]Error: Hostname not found in SSH config[/red]")
         return None
     
+    # Deferred so paramiko (and cryptography) only load when connecting
+    import paramiko
+    
+    sock = None
     try:
         client = paramiko.SSHClient()
         # AutoAddPolicy is used for DevOps CLI convenience
@@ -47,13 +59,123 @@ def create_ssh_client(host_config: dict) -> Optional[paramiko.SSHClient]:
             if os.path.exists(identity_file):
                 connect_params['key_filename'] = identity_file
         
+        tuning = get_ssh_tuning()
+        connect_timeout = tuning.get('connect_timeout') or None
+        
+        # Open the socket ourselves so TCP_NODELAY already applies to the
+        # handshake. With a socket passed in, paramiko's own connect timeout
+        # never applies, so an unreachable host is bounded here instead
+        sock = socket.create_connection((host_config['hostname'], host_config['port']), timeout=connect_timeout)
+        if tuning.get('nodelay'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connect_params['sock'] = sock
+        # Compression is negotiated during the key exchange, so it has to be
+        # requested here rather than switched on for an open transport
+        connect_params['compress'] = bool(tuning.get('compress'))
+        connect_params['banner_timeout'] = connect_timeout
+        
         client.connect(**connect_params)
+        
+        # Sessions opened from here on use the larger window
+        transport = client.get_transport()
+        transport.default_window_size = int(tuning['window_size'])
+        if tuning.get('keepalive'):
+            transport.set_keepalive(int(tuning['keepalive']))
         return client
         
     except Exception as e:
+        # A failed handshake or login can leave the transport thread and the
+        # socket open; neither is reachable once None is returned
+        if sock is not None:
+            client.close()
+            sock.close()
+        if quiet:
+            return None
         console.print(Panel(
             f"[red]Failed to connect to {host_config['hostname']}[/red]\n\n{str(e)}",
             title="Connection Error",
             border_style="red"
         ))
         return None
+
+
+# Read size for channel drains; matches paramiko's max packet size
+RECV_CHUNK_SIZE = 65536
+
+
+def _trim_to_tail(buffer: bytearray, max_output: Optional[int]):
+    """
+    Drop the head of buffer once it holds twice max_output bytes.
+    
+    Trimming only at twice the limit keeps the number of front deletions
+    low; the caller cuts the final buffer down to max_output.
+    """
+    if max_output and len(buffer) > 2 * max_output:
+        del buffer[:-max_output]
+
+
+def run_command(
+    client: "paramiko.SSHClient",
+    command: str,
+    timeout: Optional[float] = None,
+    discard_output: bool = False,
+    max_output: Optional[int] = None
+) -> Tuple[bytes, bytes, int]:
+    """
+    Run a command on a new session and drain stdout and stderr together.
+    
+    Reading both streams in one loop keeps a chatty stderr from filling the
+    channel window and stalling the remote process while stdout is read.
+    
+    Args:
+        client: Connected SSHClient
+        command: Command to execute
+        timeout: Overall wall-clock limit in seconds (None waits forever)
+        discard_output: Drain the streams without keeping them (exit code only)
+        max_output: Keep only the last max_output bytes of each stream
+        
+    Returns:
+        Tuple of (stdout bytes, stderr bytes, exit code); both streams are
+        empty when discard_output is set
+        
+    Raises:
+        socket.timeout: If the command does not finish within timeout
+    """
+    import select
+    
+    channel = client.get_transport().open_session()
+    try:
+        # Command is provided by trusted admin user for their managed infrastructure
+        channel.exec_command(command)  # nosec B601
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        out, err = bytearray(), bytearray()
+        while True:
+            # Streams are still read when discarding, or the remote side would
+            # block once the channel window fills
+            received = False
+            if channel.recv_ready():
+                data = channel.recv(RECV_CHUNK_SIZE)
+                received = True
+                if not discard_output:
+                    out += data
+                    _trim_to_tail(out, max_output)
+            if channel.recv_stderr_ready():
+                data = channel.recv_stderr(RECV_CHUNK_SIZE)
+                received = True
+                if not discard_output:
+                    err += data
+                    _trim_to_tail(err, max_output)
+            if channel.exit_status_ready() and not channel.recv_ready() and not channel.recv_stderr_ready():
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                raise socket.timeout(f"Command timed out after {timeout}s")
+            # Only wait when idle; while data is flowing, go straight back to recv
+            if not received:
+                select.select([channel], [], [], 0.1)
+        
+        if max_output:
+            return bytes(out[-max_output:]), bytes(err[-max_output:]), channel.recv_exit_status()
+        return bytes(out), bytes(err), channel.recv_exit_status()
+    finally:
+        channel.close()
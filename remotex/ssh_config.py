@@ -7,7 +7,6 @@ import re
 from pathlib import Path
 from typing import Optional, List, Dict
 
-import paramiko
 from rich.console import Console
 
 console = Console()
@@ -32,6 +31,43 @@ def ensure_ssh_config_exists():
         console.print(f"[green]Created SSH config file at {ssh_config_path}[/green]")
 
 
+# Parsed ~/.ssh/config as (cache_key, SSHConfig, host_aliases, lookups),
+# reused while the file's path, mtime and size are unchanged
+_ssh_config_cache: Optional[tuple] = None
+
+
+def _load_ssh_config(ssh_config_path: Path) -> tuple:
+    """
+    Parse the SSH config file once per file version.
+    
+    Returns:
+        Tuple of (paramiko.SSHConfig, host aliases, per-alias lookup cache)
+    """
+    global _ssh_config_cache
+    
+    stat = ssh_config_path.stat()
+    cache_key = (str(ssh_config_path), stat.st_mtime_ns, stat.st_size)
+    cached = _ssh_config_cache
+    if cached is not None and cached[0] == cache_key:
+        return cached[1:]
+    
+    # Deferred so commands that never touch SSH skip loading paramiko
+    import paramiko
+    
+    with open(ssh_config_path, 'r') as f:
+        content = f.read()
+    
+    ssh_config = paramiko.SSHConfig.from_text(content)
+    
+    # Read raw config to get all host aliases
+    host_pattern = re.compile(r'^Host\s+(.+)$', re.MULTILINE | re.IGNORECASE)
+    host_aliases = host_pattern.findall(content)
+    
+    # Assigned as one tuple so concurrent workers never see a partial entry
+    _ssh_config_cache = (cache_key, ssh_config, host_aliases, {})
+    return _ssh_config_cache[1:]
+
+
 def get_all_hosts() -> List[Dict[str, str]]:
     """
     Get all configured hosts from SSH config.
@@ -46,15 +82,7 @@ def get_all_hosts() -> List[Dict[str, str]]:
     
     hosts = []
     try:
-        ssh_config = paramiko.SSHConfig()
-        with open(ssh_config_path, 'r') as f:
-            ssh_config.parse(f)
-        
-        # Read raw config to get all host aliases
-        with open(ssh_config_path, 'r') as f:
-            content = f.read()
-            host_pattern = re.compile(r'^Host\s+(.+)$', re.MULTILINE | re.IGNORECASE)
-            host_aliases = host_pattern.findall(content)
+        ssh_config, host_aliases, _ = _load_ssh_config(ssh_config_path)
         
         for alias in host_aliases:
             # Skip wildcards and special patterns
@@ -80,6 +108,9 @@ def parse_ssh_config(host_alias: str) -> Optional[dict]:
     """
     Parse SSH config file to get host details.
     
+    Lookups are memoized per alias until ~/.ssh/config changes, so bulk
+    commands resolve each host without re-reading the file.
+    
     Args:
         host_alias: The host alias from SSH config
         
@@ -93,24 +124,55 @@ def parse_ssh_config(host_alias: str) -> Optional[dict]:
         return None
     
     try:
-        ssh_config = paramiko.SSHConfig()
-        with open(ssh_config_path, 'r') as f:
-            ssh_config.parse(f)
-        
-        host_config = ssh_config.lookup(host_alias)
-        
-        return {
-            'hostname': host_config.get('hostname'),
-            'port': int(host_config.get('port', 22)),
-            'user': host_config.get('user'),
-            'identityfile': host_config.get('identityfile', [None])[0],
-            'proxyjump': host_config.get('proxyjump')
-        }
+        ssh_config, _, lookups = _load_ssh_config(ssh_config_path)
+        return dict(_lookup_host(ssh_config, lookups, host_alias))
     except Exception as e:
         console.print(f"[red]Error parsing SSH config: {e}[/red]")
         return None
 
 
+def parse_ssh_configs(host_aliases: List[str]) -> Dict[str, Optional[dict]]:
+    """
+    Resolve connection details for many hosts with a single config check.
+    
+    Equivalent to calling parse_ssh_config() for each alias, but the file
+    is checked and loaded once for the whole list instead of once per host.
+    
+    Args:
+        host_aliases: Host aliases from SSH config
+        
+    Returns:
+        Dictionary of alias to connection details (None where lookup failed)
+    """
+    ssh_config_path = get_ssh_config_path()
+    
+    try:
+        ssh_config, _, lookups = _load_ssh_config(ssh_config_path)
+        return {alias: dict(_lookup_host(ssh_config, lookups, alias)) for alias in host_aliases}
+    except Exception:
+        # Fall back to per-host parsing, which reports the error for each host
+        return {alias: None for alias in host_aliases}
+
+
+def _lookup_host(ssh_config, lookups: Dict[str, dict], host_alias: str) -> dict:
+    """Look up one alias, memoized in the per-file-version lookup cache."""
+    cached = lookups.get(host_alias)
+    if cached is not None:
+        return cached
+    
+    host_config = ssh_config.lookup(host_alias)
+    
+    result = {
+        'hostname': host_config.get('hostname'),
+        'port': int(host_config.get('port', 22)),
+        'user': host_config.get('user'),
+        'identityfile': host_config.get('identityfile', [None])[0],
+        'proxyjump': host_config.get('proxyjump')
+    }
+    lookups[host_alias] = result
+    return result
+
+
 def add_host_to_config(alias: str, hostname: str, user: str, port: int = 22, identity_file: Optional[str] = None, jump_host: Optional[str] = None) -> bool:
     """
     Add a new host to SSH config.
@@ -0,0 +1,175 @@
+"""
+SSH Connection Pool Module
+Reuses authenticated SSH clients across commands within a single process.
+"""
+
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+from remotex.ssh_client import create_ssh_client
+from remotex.ssh_config import parse_ssh_config
+
+if TYPE_CHECKING:
+    import paramiko
+
+# Idle clients older than this are closed instead of reused; NAT devices and
+# servers commonly drop connections that have been quiet for a few minutes
+IDLE_TIMEOUT = 300
+
+
+def _is_alive(client: "paramiko.SSHClient") -> bool:
+    """Check whether a pooled client still has an active transport."""
+    transport = client.get_transport()
+    return transport is not None and transport.is_active()
+
+
+class SSHConnectionPool:
+    """
+    Thread-safe pool of connected SSH clients keyed by host alias.
+
+    Clients are handed out to one worker at a time and returned to the
+    pool afterwards, so repeated commands against the same host skip the
+    TCP + key exchange + authentication handshake. Clients left idle for
+    longer than idle_timeout seconds are closed rather than reused.
+    """
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._idle: Dict[str, queue.LifoQueue] = {}
+        self._host_locks: Dict[str, threading.Lock] = {}
+
+    def _host_lock(self, host_alias: str) -> threading.Lock:
+        with self._lock:
+            lock = self._host_locks.get(host_alias)
+            if lock is None:
+                lock = self._host_locks[host_alias] = threading.Lock()
+            return lock
+
+    def _idle_queue(self, host_alias: str) -> queue.LifoQueue:
+        with self._lock:
+            idle = self._idle.get(host_alias)
+            if idle is None:
+                idle = self._idle[host_alias] = queue.LifoQueue()
+            return idle
+
+    def get(self, host_alias: str, host_config: dict, quiet: bool = False) -> Optional["paramiko.SSHClient"]:
+        """
+        Take a live client for a host, connecting a new one if none is idle.
+
+        Args:
+            host_alias: Host alias used as the pool key
+            host_config: Parsed SSH config used when a new connection is needed
+            quiet: Suppress the connection error panel on failure
+
+        Returns:
+            Connected SSHClient or None on failure
+        """
+        idle = self._idle_queue(host_alias)
+        while True:
+            try:
+                client, released_at = idle.get_nowait()
+            except queue.Empty:
+                break
+            if time.monotonic() - released_at <= self.idle_timeout and _is_alive(client):
+                return client
+            client.close()
+
+        return create_ssh_client(host_config, quiet=quiet)
+
+    def has_idle(self, host_alias: str) -> bool:
+        """Check whether a host has a client waiting in the pool."""
+        return not self._idle_queue(host_alias).empty()
+
+    def release(self, host_alias: str, client: "paramiko.SSHClient"):
+        """Return a client to the pool, dropping it if the connection died."""
+        if _is_alive(client):
+            self._idle_queue(host_alias).put((client, time.monotonic()))
+        else:
+            client.close()
+
+    @contextmanager
+    def acquire(
+        self, host_alias: str, host_config: dict, quiet: bool = False
+    ) -> Iterator[Optional["paramiko.SSHClient"]]:
+        """
+        Context manager that borrows a client and returns it afterwards.
+
+        Workers targeting the same host take turns on one connection rather
+        than each opening their own. The client is closed instead of returned
+        if the block raises, since the connection state is unknown after a
+        failed command.
+        """
+        with self._host_lock(host_alias):
+            client = self.get(host_alias, host_config, quiet)
+            try:
+                yield client
+            except Exception:
+                if client:
+                    client.close()
+                raise
+            if client:
+                self.release(host_alias, client)
+
+    def close_all(self):
+        """Close every idle client in the pool."""
+        with self._lock:
+            idle_queues = list(self._idle.values())
+            self._idle.clear()
+
+        for idle in idle_queues:
+            while True:
+                try:
+                    client, _ = idle.get_nowait()
+                    client.close()
+                except queue.Empty:
+                    break
+                except Exception:
+                    pass
+
+
+# Shared pool for the lifetime of the CLI process
+pool = SSHConnectionPool()
+atexit.register(pool.close_all)
+
+# Handshakes are mostly waiting on the network, so they can overlap more
+# widely than the commands themselves
+PREWARM_PARALLEL = 32
+
+
+def prewarm_connections(
+    host_list: List[str],
+    parallel: int = PREWARM_PARALLEL,
+    host_configs: Optional[Dict[str, Optional[dict]]] = None
+) -> int:
+    """
+    Connect to hosts concurrently and park the clients in the shared pool.
+
+    Hosts that fail to connect are skipped silently; the command run that
+    follows reports the error when it tries again.
+
+    Args:
+        host_list: Host aliases to connect to
+        parallel: Maximum number of concurrent handshakes
+        host_configs: Pre-resolved SSH configs by alias (looked up when missing)
+
+    Returns:
+        Number of hosts with a pooled connection afterwards
+    """
+    def connect(host_alias: str) -> bool:
+        if pool.has_idle(host_alias):
+            return True
+        host_config = (host_configs or {}).get(host_alias) or parse_ssh_config(host_alias)
+        client = create_ssh_client(host_config, quiet=True) if host_config else None
+        if client is None:
+            return False
+        pool.release(host_alias, client)
+        return True
+
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        return sum(executor.map(connect, host_list))
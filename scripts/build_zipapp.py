@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Build a single-file RemoteX zipapp (dist/remotex.pyz)
+
+The archive holds the remotex package with bytecode compiled next to each
+module, so zipimport loads .pyc files straight from the archive instead of
+compiling sources on every cold start. Dependencies are not bundled: typer
+and rich are pure Python, but paramiko relies on compiled extension modules
+(cryptography, bcrypt, pynacl) that zipimport cannot load, so they must be
+installed in the interpreter that runs the archive:
+
+    python scripts/build_zipapp.py
+    python dist/remotex.pyz --help
+"""
+
+import compileall
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+OUTPUT = ROOT / "dist" / "remotex.pyz"
+
+
+def main():
+    """Stage the package, precompile it and write the archive."""
+    with tempfile.TemporaryDirectory() as staging:
+        package_dir = Path(staging) / "remotex"
+        shutil.copytree(
+            ROOT / "remotex",
+            package_dir,
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+        )
+
+        # zipimport only finds bytecode in the legacy location beside the .py
+        if not compileall.compile_dir(str(package_dir), quiet=1, legacy=True):
+            print("✗ Failed to compile remotex sources", file=sys.stderr)
+            sys.exit(1)
+
+        OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+        zipapp.create_archive(
+            staging,
+            target=OUTPUT,
+            interpreter="/usr/bin/env python3",
+            main="remotex.cli:main",
+            compressed=True,
+        )
+
+    print(f"✓ Built zipapp: {OUTPUT}")
+    print(f"  Bytecode was compiled with Python {sys.version_info.major}.{sys.version_info.minor}; "
+          f"run it with the same version")
+    print(f"\nRun with:")
+    print(f"  python {OUTPUT.relative_to(ROOT)} --help")
+
+
+if __name__ == "__main__":
+    main()
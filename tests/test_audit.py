@@ -0,0 +1,250 @@
+"""
+Tests for audit logging
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from remotex.audit import (
+    get_recent_audit_entries,
+    invalidate_audit_config_cache,
+    is_audit_enabled,
+    log_bulk_execution,
+    log_command_execution,
+    search_audit_log,
+    search_audit_log_columns,
+)
+
+
+class TestAuditLog(unittest.TestCase):
+    """Test audit log reads."""
+
+    def setUp(self):
+        """Set up a temporary audit log."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = Path(self.temp_dir.name) / "audit.log"
+
+    def tearDown(self):
+        """Clean up the temporary audit log."""
+        self.temp_dir.cleanup()
+        invalidate_audit_config_cache()
+
+    def write_entries(self, count):
+        """Write count numbered entries to the audit log."""
+        with open(self.log_file, 'w') as f:
+            for i in range(count):
+                f.write(json.dumps({"command": f"cmd-{i}", "padding": "x" * 50}) + "\n")
+
+    def test_get_recent_entries_across_blocks(self):
+        """Test that the newest entries are returned oldest-first across block boundaries."""
+        self.write_entries(200)
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file), \
+                patch('remotex.audit._TAIL_BLOCK_SIZE', 100):
+            entries = get_recent_audit_entries(5)
+
+        self.assertEqual([e["command"] for e in entries], [f"cmd-{i}" for i in range(195, 200)])
+
+    def test_get_recent_entries_through_mmap(self):
+        """Test that the mmap path returns the same entries as block reads."""
+        self.write_entries(50)
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file), \
+                patch('remotex.audit._MMAP_THRESHOLD', 0):
+            entries = get_recent_audit_entries(3)
+
+        self.assertEqual([e["command"] for e in entries], ["cmd-47", "cmd-48", "cmd-49"])
+
+    def test_get_recent_entries_skips_corrupt_lines(self):
+        """Test that corrupt lines are skipped without shrinking the result."""
+        self.write_entries(3)
+        with open(self.log_file, 'a') as f:
+            f.write("not json\n")
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file):
+            entries = get_recent_audit_entries(3)
+
+        self.assertEqual([e["command"] for e in entries], ["cmd-0", "cmd-1", "cmd-2"])
+
+    def test_get_recent_entries_more_than_available(self):
+        """Test asking for more entries than the log holds."""
+        self.write_entries(2)
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file):
+            entries = get_recent_audit_entries(10)
+
+        self.assertEqual(len(entries), 2)
+
+    def test_search_filters_and_limit(self):
+        """Test that search applies filters and keeps the newest matches."""
+        with open(self.log_file, 'w') as f:
+            for i in range(6):
+                entry = {
+                    "timestamp": f"2025-01-0{i + 1}T00:00:00Z",
+                    "user": "alice" if i % 2 else "bob",
+                    "command_type": "exec-group",
+                    "hosts": ["web1", "web2"],
+                }
+                f.write(json.dumps(entry) + "\n")
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file):
+            by_user = search_audit_log(user="alice", limit=2)
+            by_since = search_audit_log(since="2025-01-05", host="web1")
+            no_match = search_audit_log(host="db1")
+
+        self.assertEqual([e["timestamp"][:10] for e in by_user], ["2025-01-04", "2025-01-06"])
+        self.assertEqual([e["timestamp"][:10] for e in by_since], ["2025-01-05", "2025-01-06"])
+        self.assertEqual(no_match, [])
+
+    def test_search_prefilter_handles_both_encodings(self):
+        """Test that non-ASCII filter values match escaped and raw UTF-8 lines."""
+        with open(self.log_file, 'wb') as f:
+            f.write(json.dumps({"user": "zo\u00eb", "hosts": ["web1"]}).encode('utf-8') + b"\n")
+            f.write(json.dumps({"user": "zo\u00eb", "hosts": ["web2"]}, ensure_ascii=False).encode('utf-8') + b"\n")
+            f.write(json.dumps({"user": "zo", "hosts": ["web3"]}).encode('utf-8') + b"\n")
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file):
+            entries = search_audit_log(user="zo\u00eb")
+
+        self.assertEqual([e["hosts"] for e in entries], [["web1"], ["web2"]])
+
+    def test_log_appends_index_records(self):
+        """Test that each logged command adds one sidecar index record."""
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file), \
+                patch('remotex.audit.CONFIG_DIR', self.log_file.parent), \
+                patch('remotex.audit.is_audit_enabled', return_value=True):
+            for i in range(3):
+                log_command_execution("exec-all", ["web1"], f"cmd-{i}", {"web1": {"success": True}})
+            entries = get_recent_audit_entries(10)
+
+        self.assertEqual([e["command"] for e in entries], ["cmd-0", "cmd-1", "cmd-2"])
+        self.assertEqual(entries[0]["summary"], {"total": 1, "succeeded": 1, "failed": 0})
+
+        index_file = self.log_file.with_name("audit.log.idx")
+        self.assertEqual(index_file.stat().st_size, 3 * 24)
+
+    def test_search_since_uses_rebuilt_index(self):
+        """Test that a since search rebuilds a missing index and skips older entries."""
+        with open(self.log_file, 'w') as f:
+            for day in range(1, 8):
+                timestamp = f"2025-01-0{day}T12:00:00Z"
+                unix_time = 1735732800 + (day - 1) * 86400
+                f.write(json.dumps({"timestamp": timestamp, "unix_time": unix_time, "hosts": []}) + "\n")
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file):
+            entries = search_audit_log(since="2025-01-05T12:00:00")
+
+        self.assertTrue(self.log_file.with_name("audit.log.idx").exists())
+        self.assertEqual([e["timestamp"][:10] for e in entries], ["2025-01-05", "2025-01-06", "2025-01-07"])
+
+    def test_bulk_run_logs_one_entry(self):
+        """Test that a bulk run is recorded as one aggregated entry."""
+        results = [
+            {"host": "web1", "success": True, "exit_code": 0, "output": "ok"},
+            {"host": "web2", "success": False, "exit_code": 2, "output": ""},
+        ]
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file), \
+                patch('remotex.audit.CONFIG_DIR', self.log_file.parent), \
+                patch('remotex.audit.is_audit_enabled', return_value=True):
+            log_bulk_execution("exec-all", "uptime", results)
+            entries = get_recent_audit_entries(10)
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["hosts"], ["web1", "web2"])
+        self.assertEqual(entries[0]["summary"], {"total": 2, "succeeded": 1, "failed": 1})
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file):
+            columns = search_audit_log_columns(command_type="exec-all")
+
+        self.assertEqual(len(columns.timestamps), 1)
+        self.assertEqual(columns.commands, ["uptime"])
+        self.assertEqual(list(columns.host_counts), [2])
+        self.assertEqual(list(columns.succeeded), [1])
+
+    def test_bulk_run_skipped_when_disabled(self):
+        """Test that nothing is logged or touched when auditing is disabled."""
+        results = [{"host": "web1", "success": True, "exit_code": 0, "output": "ok"}]
+        with patch('remotex.audit.is_audit_enabled', return_value=False), \
+                patch('remotex.audit.log_command_execution') as mock_log:
+            log_bulk_execution("exec-all", "uptime", results, results_can_mutate=True)
+
+        mock_log.assert_not_called()
+        self.assertEqual(results[0]["output"], "ok")
+
+    def test_mutable_results_match_copied_results(self):
+        """Test that reusing result dicts produces the same entry as copying them."""
+        def make_results():
+            return {
+                "web1": {"host": "web1", "success": True, "exit_code": 0, "output": "ok", "error": ""},
+                "web2": {"host": "web2", "success": False, "exit_code": 2, "output": "", "error": "boom"},
+            }
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file), \
+                patch('remotex.audit.CONFIG_DIR', self.log_file.parent), \
+                patch('remotex.audit.is_audit_enabled', return_value=True):
+            log_command_execution("exec-group", ["web1", "web2"], "uptime", make_results())
+            log_command_execution("exec-group", ["web1", "web2"], "uptime", make_results(),
+                                  results_can_mutate=True)
+            copied, reused = get_recent_audit_entries(2)
+
+        self.assertEqual(copied["results"], reused["results"])
+        self.assertEqual(copied["summary"], reused["summary"])
+
+    def test_audit_enabled_read_once(self):
+        """Test that the audit setting is read from config once until invalidated."""
+        invalidate_audit_config_cache()
+        with patch('remotex.audit.load_config', return_value={"audit_enabled": False}) as mock_load:
+            self.assertFalse(is_audit_enabled())
+            self.assertFalse(is_audit_enabled())
+            self.assertEqual(mock_load.call_count, 1)
+
+            invalidate_audit_config_cache()
+            is_audit_enabled()
+            self.assertEqual(mock_load.call_count, 2)
+
+    def test_audit_env_override_skips_config(self):
+        """Test that REMOTEX_AUDIT_ENABLED answers without loading config."""
+        invalidate_audit_config_cache()
+        with patch.dict('os.environ', {'REMOTEX_AUDIT_ENABLED': '0'}), \
+                patch('remotex.audit.load_config') as mock_load:
+            self.assertFalse(is_audit_enabled())
+            mock_load.assert_not_called()
+
+    def test_log_rotation_keeps_entries_readable(self):
+        """Test that a full log is rotated and recent entries span the backups."""
+        config = {"audit_enabled": True, "audit_max_size": 600}
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file), \
+                patch('remotex.audit.CONFIG_DIR', self.log_file.parent), \
+                patch('remotex.audit.load_config', return_value=config), \
+                patch('remotex.audit._FLUSH_INTERVAL', 0):
+            invalidate_audit_config_cache()
+            for i in range(6):
+                log_command_execution("exec-all", ["web1"], f"cmd-{i}", {"web1": {"success": True}})
+                get_recent_audit_entries(1)
+            entries = get_recent_audit_entries(10)
+            recent = search_audit_log(since="2000-01-01", limit=10)
+
+        self.assertTrue(self.log_file.with_name("audit.log.1").exists())
+        self.assertLessEqual(self.log_file.stat().st_size, 600)
+        self.assertEqual([e["command"] for e in entries], [f"cmd-{i}" for i in range(6)])
+        self.assertEqual(recent, entries)
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file), \
+                patch('remotex.audit._PARALLEL_SCAN_THRESHOLD', 0):
+            parallel = search_audit_log(limit=4)
+            columns = search_audit_log_columns(limit=4)
+
+        self.assertEqual(parallel, entries[-4:])
+        self.assertEqual(columns.commands, [e["command"] for e in entries[-4:]])
+
+        with patch('remotex.audit.AUDIT_LOG_FILE', self.log_file):
+            columns = search_audit_log_columns(limit=4)
+
+        self.assertEqual(columns.commands, [e["command"] for e in entries[-4:]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,354 @@
+"""
+Tests for bulk execution output
+"""
+
+import csv
+import io
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import typer
+from rich.console import Console
+from typer.testing import CliRunner
+
+from remotex.commands import bulk_operations
+from remotex.commands.bulk_operations import (
+    _add_summary_row, _CsvReport, _execute_without_progress, _in_host_order, _JsonReport, _longest_first,
+    _run_shard, _summary_table
+)
+from remotex import async_exec
+from remotex.ssh_client import run_command
+
+
+def make_result(host, success=True):
+    """Build a result dict as returned by execute_on_host."""
+    return {
+        'host': host,
+        'success': success,
+        'output': f'out {host}\nline2' if success else '',
+        'error': '' if success else 'failed',
+        'exit_code': 0 if success else 1
+    }
+
+
+class TestStreamingOutput(unittest.TestCase):
+    """Test results streamed while hosts are still running."""
+
+    def test_in_host_order(self):
+        """Test that results finishing early are held until earlier hosts finish."""
+        delivered = []
+        deliver = _in_host_order(['a', 'b', 'c'], lambda r: delivered.append(r['host']))
+
+        deliver(make_result('c'))
+        self.assertEqual(delivered, [])
+        deliver(make_result('a'))
+        self.assertEqual(delivered, ['a'])
+        deliver(make_result('b'))
+        self.assertEqual(delivered, ['a', 'b', 'c'])
+
+    def test_in_host_order_flushes_per_release(self):
+        """Test that flush runs once per group of released results."""
+        flushes = []
+        deliver = _in_host_order(['a', 'b', 'c'], lambda r: None, lambda: flushes.append(True))
+
+        deliver(make_result('c'))
+        deliver(make_result('b'))
+        self.assertEqual(flushes, [])
+        deliver(make_result('a'))
+        self.assertEqual(flushes, [True])
+
+    @patch('remotex.retry.time.sleep')
+    @patch('remotex.commands.bulk_operations.get_ssh_backend', return_value='paramiko')
+    @patch('remotex.commands.bulk_operations._run_via_paramiko', side_effect=OSError('unreachable'))
+    def test_retry_exception_keeps_host(self, mock_run, mock_backend, mock_sleep):
+        """Test that a retried run that keeps raising still reports its host."""
+        result = bulk_operations.execute_on_host('web1', 'uptime', retries=1)
+
+        self.assertEqual(result['host'], 'web1')
+        self.assertEqual(result['error'], 'unreachable')
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch('remotex.commands.bulk_operations._run_in_processes')
+    @patch('remotex.commands.bulk_operations._use_async_backend', return_value=True)
+    def test_crypto_parallel_overrides_async_backend(self, mock_async, mock_processes):
+        """Test that --crypto-parallel uses process shards even when asyncssh would run."""
+        hosts = [f'h{i}' for i in range(bulk_operations.CRYPTO_PARALLEL_MIN_HOSTS)]
+        mock_processes.return_value = [make_result(host) for host in hosts]
+
+        bulk = _execute_without_progress(hosts, 'uptime', 10, 30, 0, crypto_parallel=True)
+
+        mock_processes.assert_called_once()
+        mock_async.assert_not_called()
+        self.assertEqual(len(bulk.results), len(hosts))
+
+    @patch('remotex.commands.bulk_operations.execute_on_host')
+    def test_run_shard_keeps_order(self, mock_execute):
+        """Test that a worker process's shard runs every host and keeps their order."""
+        mock_execute.side_effect = lambda host, **kwargs: make_result(host)
+
+        configs = {'a': {'hostname': '10.0.0.1'}, 'b': None, 'c': None}
+
+        results = _run_shard(['a', 'b', 'c'], 'uptime', 30, 0, False, None, 2, configs)
+
+        self.assertEqual([r['host'] for r in results], ['a', 'b', 'c'])
+        self.assertEqual(mock_execute.call_args.kwargs['command'], 'uptime')
+        self.assertIn({'hostname': '10.0.0.1'}, [c.kwargs['host_config'] for c in mock_execute.call_args_list])
+
+    def test_longest_first(self):
+        """Test that unknown hosts and then the slowest hosts are scheduled first."""
+        durations = {'fast': 0.5, 'slow': 9.0, 'medium': 2.0}
+
+        order = _longest_first(['fast', 'new', 'slow', 'medium'], durations)
+
+        self.assertEqual(order, ['new', 'slow', 'medium', 'fast'])
+
+    def test_json_report(self):
+        """Test that the streamed JSON document parses with every result and total."""
+        results = [make_result('a'), make_result('b', success=False)]
+        out = io.StringIO()
+        with patch('sys.stdout', out):
+            report = _JsonReport({"command": "uptime", "hosts": ['a', 'b']})
+            for result in results:
+                report.write(result)
+            report.close(2, 1, 1)
+
+        data = json.loads(out.getvalue())
+        self.assertEqual(data['hosts'], ['a', 'b'])
+        self.assertEqual([r['host'] for r in data['results']], ['a', 'b'])
+        self.assertEqual(data['results'][0]['output'], 'out a\nline2')
+        self.assertEqual((data['total'], data['succeeded'], data['failed']), (2, 1, 1))
+
+    def test_json_report_binary_stdout(self):
+        """Test that encoded bytes are written to stdout's binary buffer."""
+        out = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+        with patch('sys.stdout', out):
+            report = _JsonReport({"command": "echo \u00e9"})
+            report.write(make_result('a'))
+            report.close(1, 1, 0)
+
+        data = json.loads(out.buffer.getvalue())
+        self.assertEqual(data['command'], 'echo \u00e9')
+        self.assertEqual(data['results'][0]['host'], 'a')
+
+    def test_json_report_empty(self):
+        """Test that a report with no results is still valid JSON."""
+        out = io.StringIO()
+        with patch('sys.stdout', out):
+            report = _JsonReport({"command": "uptime"})
+            report.close(0, 0, 0)
+
+        self.assertEqual(json.loads(out.getvalue())['results'], [])
+
+    def test_csv_report_writes_on_flush(self):
+        """Test that CSV rows reach stdout on flush with newlines flattened."""
+        out = io.StringIO()
+        with patch('sys.stdout', out):
+            report = _CsvReport()
+            report.write(make_result('a'))
+            self.assertEqual(len(out.getvalue().splitlines()), 1)
+            report.flush()
+
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        self.assertEqual(rows[0], ["Host", "Success", "ExitCode", "Output", "Error"])
+        self.assertEqual(rows[1], ['a', 'True', '0', 'out a line2', ''])
+
+
+class TestThreadedExecution(unittest.TestCase):
+    """Test the threaded bulk executor with the host runs mocked out."""
+
+    def setUp(self):
+        # Threaded paramiko path with no SSH config lookups, prewarming or
+        # duration cache; each test varies only what it needs
+        self.start_patch('_use_async_backend', return_value=False)
+        self.start_patch('_host_configs', return_value={})
+        self.start_patch('_prewarm')
+        self.mock_cached = self.start_patch('get_cached_data', return_value=None)
+        self.mock_cache = self.start_patch('cache_data')
+        self.mock_execute = self.start_patch(
+            'execute_on_host', side_effect=lambda host, *args, **kwargs: make_result(host)
+        )
+
+    def start_patch(self, name, **kwargs):
+        """Patch a bulk_operations attribute for the rest of the test."""
+        patcher = patch.object(bulk_operations, name, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_execute_counts_and_streams(self):
+        """Test that results stream in host order, counts are returned and durations saved."""
+        self.mock_cached.return_value = {'a': 0.1, 'b': 0.2, 'c': 5.0}
+        self.mock_execute.side_effect = lambda host, *args, **kwargs: make_result(host, success=host != 'b')
+        streamed = []
+
+        bulk = _execute_without_progress(
+            ['a', 'b', 'c'], 'uptime', 2, 30, 0, on_result=lambda r: streamed.append(r['host'])
+        )
+
+        self.assertEqual([r['host'] for r in bulk.results], ['a', 'b', 'c'])
+        self.assertEqual(streamed, ['a', 'b', 'c'])
+        self.assertEqual((bulk.success_count, bulk.failed_count), (2, 1))
+        self.assertEqual(set(self.mock_cache.call_args[0][1]), {'a', 'b', 'c'})
+
+    def test_execute_more_hosts_than_window(self):
+        """Test that hosts beyond the submission window are still run, in order."""
+        hosts = [f'h{i}' for i in range(20)]
+
+        bulk = _execute_without_progress(hosts, 'uptime', 2, 30, 0)
+
+        self.assertEqual([r['host'] for r in bulk.results], hosts)
+        self.assertEqual(bulk.success_count, 20)
+
+    def test_execute_quiet_connects(self):
+        """Test that streamed report runs keep connection error panels off stdout."""
+        _execute_without_progress(['a', 'b'], 'uptime', 2, 30, 0, quiet=True)
+
+        self.assertTrue(all(c.kwargs['quiet'] for c in self.mock_execute.call_args_list))
+
+    def test_execute_host_exception(self):
+        """Test that a host whose run raises becomes a failed result instead of aborting the run."""
+        def execute(host, *args, **kwargs):
+            if host == 'b':
+                raise RuntimeError('boom')
+            return make_result(host)
+        self.mock_execute.side_effect = execute
+
+        bulk = _execute_without_progress(['a', 'b', 'c'], 'uptime', 2, 30, 0)
+
+        self.assertEqual([r['host'] for r in bulk.results], ['a', 'b', 'c'])
+        self.assertEqual(bulk.results[1]['error'], 'boom')
+        self.assertEqual((bulk.success_count, bulk.failed_count), (2, 1))
+
+
+class TestSummaryTable(unittest.TestCase):
+    """Test the per-host summary table."""
+
+    def test_preview_is_not_markup(self):
+        """Test that output resembling rich markup is shown literally."""
+        table = _summary_table()
+        result = make_result('a', success=False)
+        result['error'] = 'oops [/red] [bold]x'
+        _add_summary_row(table, result)
+
+        console = Console(file=io.StringIO(), width=100)
+        console.print(table)
+
+        self.assertIn('oops [/red] [bold]x', console.file.getvalue())
+
+
+class TestProgressDisplay(unittest.TestCase):
+    """Test the shared progress display's lifetime."""
+
+    def test_live_display_stops_between_runs(self):
+        """Test that the live display only runs while a run has a task."""
+        with patch.object(type(bulk_operations.console), 'is_terminal', new=True):
+            progress, first = bulk_operations._start_progress_task('first', 1)
+            _, second = bulk_operations._start_progress_task('second', 1)
+            try:
+                self.assertTrue(progress.live.is_started)
+                bulk_operations._finish_progress_task(first)
+                self.assertTrue(progress.live.is_started)
+            finally:
+                bulk_operations._finish_progress_task(second)
+
+        self.assertFalse(progress.live.is_started)
+
+
+class TestAsyncFanOut(unittest.TestCase):
+    """Test the asyncssh fan-out loop without connecting anywhere."""
+
+    @staticmethod
+    async def fake_run_one(sem, host, *args):
+        async with sem:
+            return make_result(host, success=host != 'b')
+
+    def test_run_all_reports_every_result(self):
+        """Test that every completion reaches on_result and results keep host order."""
+        seen = []
+        hosts = ['a', 'b', 'c', 'd']
+        with patch.object(async_exec, 'run_one', self.fake_run_one):
+            results = async_exec.run_all(hosts, 'uptime', parallel=2, on_result=lambda r: seen.append(r['host']))
+
+        self.assertEqual([r['host'] for r in results], hosts)
+        self.assertEqual(sorted(seen), hosts)
+
+    def test_run_all_without_callback(self):
+        """Test that results are gathered in host order without on_result."""
+        with patch.object(async_exec, 'run_one', self.fake_run_one):
+            results = async_exec.run_all(['a', 'b'], 'uptime')
+
+        self.assertEqual([r['success'] for r in results], [True, False])
+
+
+class TestOutputCap(unittest.TestCase):
+    """Test the per-host output cap."""
+
+    def test_negative_cap_rejected(self):
+        """Test that every bulk command refuses a negative --max-output-bytes before running."""
+        app = typer.Typer()
+        bulk_operations.register_bulk_commands(app)
+        runner = CliRunner()
+
+        for args in (['exec-all', 'uptime'], ['exec-multi', 'web1', 'uptime'], ['exec-group', 'web', 'uptime']):
+            with patch.object(bulk_operations, '_execute_without_progress') as mock_quiet, \
+                    patch.object(bulk_operations, '_execute_with_progress') as mock_progress:
+                result = runner.invoke(app, args + ['--max-output-bytes', '-1'])
+
+            self.assertEqual(result.exit_code, 2, args)
+            mock_quiet.assert_not_called()
+            mock_progress.assert_not_called()
+
+    def make_client(self, chunks):
+        """Build a mock client whose channel returns chunks of stdout, then exits."""
+        pending = list(chunks)
+        channel = MagicMock()
+        channel.recv_ready.side_effect = lambda: bool(pending)
+        channel.recv.side_effect = lambda size: pending.pop(0)
+        channel.recv_stderr_ready.return_value = False
+        channel.exit_status_ready.return_value = True
+        channel.recv_exit_status.return_value = 0
+        client = MagicMock()
+        client.get_transport.return_value.open_session.return_value = channel
+        return client
+
+    def test_run_command_keeps_tail(self):
+        """Test that only the last max_output bytes are kept."""
+        client = self.make_client([b"a" * 10, b"b" * 10, b"c" * 10])
+
+        output, error, exit_code = run_command(client, "cat big", max_output=15)
+
+        self.assertEqual(output, b"b" * 5 + b"c" * 10)
+        self.assertEqual((error, exit_code), (b"", 0))
+
+    def test_run_command_uncapped(self):
+        """Test that output is kept whole without a cap."""
+        client = self.make_client([b"a" * 10, b"b" * 10])
+
+        output, _, _ = run_command(client, "cat big")
+
+        self.assertEqual(output, b"a" * 10 + b"b" * 10)
+
+    def run_capped(self, chunks, max_output):
+        """Run a command over a pooled mock client with an output cap."""
+        pool = MagicMock()
+        pool.acquire.return_value.__enter__.return_value = self.make_client(chunks)
+        with patch.object(bulk_operations, 'pool', pool):
+            return bulk_operations._run_via_paramiko('web1', 'cat big', 30, host_config={'hostname': 'web1'}, max_output=max_output)
+
+    def test_cut_output_is_marked_truncated(self):
+        """Test that a result cut by the cap says so and keeps the tail."""
+        result = self.run_capped([b"a" * 10, b"b" * 10], 15)
+
+        self.assertEqual(result['output'], "a" * 5 + "b" * 10)
+        self.assertTrue(result['truncated'])
+
+    def test_output_within_cap_not_truncated(self):
+        """Test that output exactly at the cap is not reported as truncated."""
+        result = self.run_capped([b"a" * 10, b"b" * 5], 15)
+
+        self.assertEqual(result['output'], "a" * 10 + "b" * 5)
+        self.assertNotIn('truncated', result)
+
+
+if __name__ == '__main__':
+    unittest.main()
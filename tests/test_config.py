@@ -7,12 +7,15 @@ from unittest.mock import patch
 import tempfile
 import json
 import os
+from pathlib import Path
 
 from remotex.config import (
     load_config,
     save_config,
     get_default_server,
-    set_default_server
+    set_default_server,
+    get_ssh_tuning,
+    DEFAULT_SSH_TUNING
 )
 
 
@@ -45,6 +48,50 @@ class TestConfig(unittest.TestCase):
         finally:
             os.unlink(temp_path)
     
+    def test_save_config_invalidates_cache(self):
+        """Test that load_config sees changes written by save_config."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            with patch('remotex.config.CONFIG_FILE', config_file):
+                config = load_config()
+                config['default_server'] = 'web01'
+                save_config(config)
+                
+                self.assertEqual(load_config()['default_server'], 'web01')
+    
+    def test_load_config_returns_copy(self):
+        """Test that mutating a loaded config does not leak into the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            with patch('remotex.config.CONFIG_FILE', config_file):
+                config = load_config()
+                config['groups']['web'] = ['web01']
+                
+                self.assertEqual(load_config()['groups'], {})
+    
+    def test_save_config_leaves_no_temp_files(self):
+        """Test that save_config replaces config.json without leftovers."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            with patch('remotex.config.CONFIG_FILE', config_file):
+                save_config({'default_server': 'web01'})
+                save_config({'default_server': 'web02'})
+                
+                self.assertEqual(os.listdir(temp_dir), ['config.json'])
+                self.assertEqual(json.loads(config_file.read_text())['default_server'], 'web02')
+    
+    def test_get_ssh_tuning_fills_defaults(self):
+        """Test that a partial ssh config keeps the remaining defaults."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            config_file.write_text(json.dumps({'ssh': {'nodelay': False}}))
+            with patch('remotex.config.CONFIG_FILE', config_file):
+                tuning = get_ssh_tuning()
+                
+                self.assertFalse(tuning['nodelay'])
+                self.assertEqual(tuning['window_size'], DEFAULT_SSH_TUNING['window_size'])
+                self.assertFalse(tuning['compress'])
+    
     def test_get_default_server(self):
         """Test getting default server."""
         with patch('remotex.config.load_config') as mock_load:
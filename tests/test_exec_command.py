@@ -0,0 +1,54 @@
+"""
+Tests for the exec command
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import typer
+
+from remotex.commands import exec_command as exec_module
+
+
+@patch.object(exec_module, 'record_history')
+@patch.object(exec_module, 'get_ssh_backend', return_value='paramiko')
+@patch.object(exec_module, 'create_ssh_client', return_value=MagicMock())
+@patch.object(exec_module, 'parse_ssh_config', return_value={'hostname': 'h', 'port': 22, 'user': 'u'})
+class TestExecCommand(unittest.TestCase):
+    """Test exec exit codes and error reporting."""
+
+    def run_exec(self, **modes):
+        """Run exec in the given output mode and return the exit code."""
+        options = dict(plain=False, compact=False, silent=False)
+        options.update(modes)
+        with self.assertRaises(typer.Exit) as raised:
+            exec_module.exec_command('web1', 'false', **options)
+        return raised.exception.exit_code
+
+    def test_remote_exit_status_is_kept(self, *mocks):
+        """Test that a failing command exits with its own status, not an execution error."""
+        with patch.object(exec_module, 'run_command', return_value=(b'', b'', 3)), \
+                patch.object(exec_module.console, 'print') as mock_print:
+            self.assertEqual(self.run_exec(silent=True), 3)
+
+        mock_print.assert_not_called()
+
+    def test_paramiko_path_has_no_time_limit(self, *mocks):
+        """Test that the paramiko path lets long commands run regardless of the config timeout."""
+        with patch.object(exec_module, 'get_timeout', return_value=12), \
+                patch.object(exec_module, 'run_command', return_value=(b'', b'', 1)) as mock_run:
+            self.run_exec(silent=True)
+
+        self.assertIsNone(mock_run.call_args.kwargs['timeout'])
+
+    def test_silent_error_prints_nothing(self, *mocks):
+        """Test that execution errors exit 1 without output in silent mode."""
+        with patch.object(exec_module, 'run_command', side_effect=OSError('boom')), \
+                patch.object(exec_module.console, 'print') as mock_print:
+            self.assertEqual(self.run_exec(silent=True), 1)
+
+        mock_print.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
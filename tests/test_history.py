@@ -0,0 +1,47 @@
+"""
+Tests for command history
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from remotex.history import flush_history, get_history, record_history
+
+
+class TestHistory(unittest.TestCase):
+    """Test command history recording."""
+
+    def setUp(self):
+        """Point the history file at a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        config_dir = Path(self.temp_dir.name)
+        self.patches = [
+            patch('remotex.history.CONFIG_DIR', config_dir),
+            patch('remotex.history.HISTORY_FILE', config_dir / "history.json"),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        """Drain queued entries before removing the directory."""
+        flush_history()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    def test_record_history_is_read_back(self):
+        """Test that queued entries are written before history is read."""
+        record_history("exec-multi", ["uptime"], ["web01", "web02"], success=False, metadata={"failed": 1})
+        record_history("exec", ["df -h"], ["web01"])
+
+        entries = get_history()
+
+        self.assertEqual([e["command"] for e in entries], ["exec-multi", "exec"])
+        self.assertEqual(entries[0]["metadata"], {"failed": 1})
+        self.assertFalse(entries[0]["success"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Tests for SSH client creation
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import paramiko
+
+from remotex.ssh_client import create_ssh_client
+
+
+HOST_CONFIG = {'hostname': '10.0.0.1', 'port': 22, 'user': 'admin'}
+
+
+@patch('remotex.ssh_client.get_ssh_tuning', return_value={
+    'window_size': 1024, 'nodelay': True, 'keepalive': 0, 'compress': False, 'connect_timeout': 7
+})
+@patch('remotex.ssh_client.socket.create_connection')
+class TestCreateSSHClient(unittest.TestCase):
+    """Test connection setup without touching the network."""
+
+    def test_connect_uses_configured_timeout(self, mock_connect, mock_tuning):
+        """Test that the TCP connect is bounded by the configured connect timeout."""
+        with patch.object(paramiko.SSHClient, 'connect'), \
+                patch.object(paramiko.SSHClient, 'get_transport', return_value=MagicMock()):
+            client = create_ssh_client(HOST_CONFIG, quiet=True)
+
+        self.assertIsNotNone(client)
+        self.assertEqual(mock_connect.call_args.kwargs['timeout'], 7)
+
+    def test_socket_closed_when_handshake_fails(self, mock_connect, mock_tuning):
+        """Test that the socket is closed when the SSH connect fails."""
+        with patch.object(paramiko.SSHClient, 'connect', side_effect=paramiko.SSHException('banner')):
+            client = create_ssh_client(HOST_CONFIG, quiet=True)
+
+        self.assertIsNone(client)
+        mock_connect.return_value.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@
 Tests for SSH config management
 """
 
+import os
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch, mock_open
@@ -11,6 +13,7 @@ from remotex.ssh_config import (
     ensure_ssh_config_exists,
     get_all_hosts,
     parse_ssh_config,
+    parse_ssh_configs,
     add_host_to_config,
     host_exists
 )
@@ -57,6 +60,42 @@ Host test2
         finally:
             os.unlink(temp_path)
     
+    @patch('remotex.ssh_config.get_ssh_config_path')
+    def test_parse_ssh_configs(self, mock_path):
+        """Test resolving several hosts in one pass."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write(self.test_config)
+            temp_path = f.name
+        
+        try:
+            mock_path.return_value = Path(temp_path)
+            configs = parse_ssh_configs(["test1", "test2"])
+            
+            self.assertEqual(configs["test1"], parse_ssh_config("test1"))
+            self.assertEqual(configs["test2"]['port'], 2222)
+            self.assertEqual(mock_path.call_count, 2)
+        finally:
+            os.unlink(temp_path)
+    
+    @patch('remotex.ssh_config.get_ssh_config_path')
+    def test_parse_ssh_config_reloads_on_change(self, mock_path):
+        """Test that cached SSH config is refreshed when the file changes."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write(self.test_config)
+            temp_path = f.name
+        
+        try:
+            mock_path.return_value = Path(temp_path)
+            self.assertEqual(parse_ssh_config("test2")['port'], 2222)
+            
+            with open(temp_path, 'w') as f:
+                f.write(self.test_config.replace("Port 2222", "Port 2200"))
+            
+            self.assertEqual(parse_ssh_config("test2")['port'], 2200)
+            self.assertEqual(len(get_all_hosts()), 2)
+        finally:
+            os.unlink(temp_path)
+    
     def test_host_exists(self):
         """Test checking if host exists."""
         # This would need mocking of get_all_hosts
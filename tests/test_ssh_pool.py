@@ -0,0 +1,157 @@
+"""
+Tests for SSH connection pooling
+"""
+
+import socket
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from remotex.ssh_pool import SSHConnectionPool, prewarm_connections
+
+
+def make_client(active=True):
+    """Build a mock SSHClient with a transport in the given state."""
+    client = MagicMock()
+    client.get_transport.return_value.is_active.return_value = active
+    return client
+
+
+class TestSSHConnectionPool(unittest.TestCase):
+    """Test SSH connection pool operations."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.pool = SSHConnectionPool()
+        self.host_config = {'hostname': '192.168.1.1', 'port': 22, 'user': 'ubuntu'}
+
+    @patch('remotex.ssh_pool.create_ssh_client')
+    def test_reuses_released_client(self, mock_create):
+        """Test that a released client is handed out again."""
+        client = make_client()
+        mock_create.return_value = client
+
+        with self.pool.acquire('web01', self.host_config) as first:
+            pass
+        with self.pool.acquire('web01', self.host_config) as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_create.call_count, 1)
+
+    @patch('remotex.ssh_pool.create_ssh_client')
+    def test_closes_expired_idle_client(self, mock_create):
+        """Test that clients idle past the timeout are closed and replaced."""
+        stale, fresh = make_client(), make_client()
+        mock_create.return_value = fresh
+        pool = SSHConnectionPool(idle_timeout=60)
+
+        with patch('remotex.ssh_pool.time.monotonic', return_value=1000.0):
+            pool.release('web01', stale)
+        with patch('remotex.ssh_pool.time.monotonic', return_value=1061.0):
+            client = pool.get('web01', self.host_config)
+
+        self.assertIs(client, fresh)
+        stale.close.assert_called_once()
+
+    @patch('remotex.ssh_pool.create_ssh_client')
+    def test_replaces_dead_client(self, mock_create):
+        """Test that dead clients are closed and replaced."""
+        dead = make_client()
+        fresh = make_client()
+        mock_create.side_effect = [dead, fresh]
+
+        with self.pool.acquire('web01', self.host_config):
+            pass
+        dead.get_transport.return_value.is_active.return_value = False
+
+        with self.pool.acquire('web01', self.host_config) as client:
+            self.assertIs(client, fresh)
+        dead.close.assert_called_once()
+
+    @patch('remotex.ssh_pool.create_ssh_client')
+    def test_closes_client_on_error(self, mock_create):
+        """Test that a client is not returned to the pool after a failure."""
+        client = make_client()
+        mock_create.return_value = client
+
+        with self.assertRaises(RuntimeError):
+            with self.pool.acquire('web01', self.host_config):
+                raise RuntimeError("channel failed")
+
+        client.close.assert_called_once()
+        with self.pool.acquire('web01', self.host_config):
+            pass
+        self.assertEqual(mock_create.call_count, 2)
+
+    @patch('remotex.commands.bulk_operations.run_command', side_effect=socket.timeout)
+    @patch('remotex.commands.bulk_operations.parse_ssh_config')
+    @patch('remotex.ssh_pool.create_ssh_client')
+    def test_command_timeout_keeps_connection(self, mock_create, mock_parse, mock_run):
+        """Test that a timed-out command leaves its connection in the pool."""
+        from remotex.commands import bulk_operations
+
+        client = make_client()
+        mock_create.return_value = client
+        mock_parse.return_value = self.host_config
+
+        with patch.object(bulk_operations, 'pool', self.pool):
+            result = bulk_operations._run_via_paramiko('web01', 'sleep 60', 1)
+
+        self.assertIn('timed out', result['error'])
+        client.close.assert_not_called()
+        self.assertTrue(self.pool.has_idle('web01'))
+
+    @patch('remotex.ssh_pool.create_ssh_client')
+    def test_same_host_shares_one_connection(self, mock_create):
+        """Test that concurrent workers on one host reuse a single client."""
+        mock_create.side_effect = lambda config, **kwargs: make_client()
+        clients = []
+
+        def worker():
+            with self.pool.acquire('web01', self.host_config) as client:
+                clients.append(client)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_create.call_count, 1)
+        self.assertEqual(len(set(map(id, clients))), 1)
+
+    @patch('remotex.ssh_pool.create_ssh_client')
+    def test_close_all(self, mock_create):
+        """Test closing all idle clients."""
+        client = make_client()
+        mock_create.return_value = client
+
+        with self.pool.acquire('web01', self.host_config):
+            pass
+        self.pool.close_all()
+
+        client.close.assert_called_once()
+
+
+class TestPrewarmConnections(unittest.TestCase):
+    """Test prewarming the shared pool."""
+
+    @patch('remotex.ssh_pool.pool', new_callable=SSHConnectionPool)
+    @patch('remotex.ssh_pool.parse_ssh_config')
+    @patch('remotex.ssh_pool.create_ssh_client')
+    def test_prewarm_pools_connected_hosts(self, mock_create, mock_parse, mock_pool):
+        """Test that connected hosts are pooled and failures are skipped."""
+        web01 = make_client()
+        mock_parse.side_effect = lambda alias: {'hostname': alias, 'port': 22}
+        mock_create.side_effect = lambda config, quiet: web01 if config['hostname'] == 'web01' else None
+
+        connected = prewarm_connections(['web01', 'web02'], parallel=2)
+
+        self.assertEqual(connected, 1)
+        self.assertTrue(mock_pool.has_idle('web01'))
+        self.assertFalse(mock_pool.has_idle('web02'))
+
+
+if __name__ == '__main__':
+    unittest.main()